@@ -1,7 +1,7 @@
-from typing import Annotated, Tuple, Generator
+from typing import Annotated, Tuple
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from sqlalchemy import select, and_
@@ -9,21 +9,14 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.security import decode_token, get_tenant_id_from_token
-from app.db.session import SessionLocal
+from app.db.session import get_db as get_db_session
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.api_prefix}/auth/login")
 
 
-def get_db_session() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 def get_current_user_with_tenant(
+    request: Request,
     token: Annotated[str, Depends(oauth2_scheme)],
     session: Annotated[Session, Depends(get_db_session)],
 ) -> Tuple[User, UUID]:
@@ -34,7 +27,8 @@ def get_current_user_with_tenant(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = decode_token(token)
+        # The request middleware already verified this header's token
+        payload = getattr(request.state, "jwt_claims", None) or decode_token(token)
         user_id = payload.get("sub")
         tenant_id = payload.get("tenant_id")
 
@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 
 from app.api.deps import (
@@ -199,7 +200,9 @@ async def razorpay_callback(
         )
 
     try:
-        payment = payment_service.verify_and_update_payment(
+        # The service layer uses a sync Session; keep it off the event loop
+        payment = await run_in_threadpool(
+            payment_service.verify_and_update_payment,
             order_id=order_id,
             payment_id=payment_id,
             signature=signature,
@@ -216,7 +219,8 @@ async def razorpay_callback(
         ) from exc
 
     # Mark sale as paid
-    sales_service.update_payment_status(
+    await run_in_threadpool(
+        sales_service.update_payment_status,
         sale_id=payment.sale_id,
         tenant_id=payment.tenant_id,
         payment_status="paid",
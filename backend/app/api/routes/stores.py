@@ -41,8 +41,9 @@ def get_stores(
     - Cashier: Their assigned store only
     """
     if current_user.role == "super_admin" or current_user.role == "manager":
-        # Super admin and manager can see all stores
-        stores = crud_store.get_multi(
+        # Super admin and manager can see all stores; read-only listing, so
+        # plain rows are enough
+        stores = crud_store.get_multi_rows(
             session,
             skip=skip,
             limit=limit,
@@ -147,19 +148,18 @@ def get_store_statistics(
     tenant_id: UUID = Depends(get_tenant_id),
 ) -> dict:
     """Get store statistics (manager and super admin only)"""
-    # Verify store exists
-    store =  crud_store.get(session, id=store_id, tenant_id=tenant_id)
-    if not store:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Store not found"
-        )
-
-    stats =  crud_store.get_store_statistics(
+    # The statistics statement is scoped to the store row, so an empty result
+    # means the store does not exist for this tenant
+    stats = crud_store.get_store_statistics(
         session,
         store_id=store_id,
         tenant_id=tenant_id,
     )
+    if not stats:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Store not found"
+        )
 
     return StoreStats.model_validate(stats)
 
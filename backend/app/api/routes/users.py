@@ -2,6 +2,7 @@ from typing import Sequence
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import (
@@ -13,6 +14,7 @@ from app.api.deps import (
     get_tenant_id,
     get_store_id,
 )
+from app.crud.crud_user import crud_user
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
 from app.services.users import (
@@ -20,11 +22,56 @@ from app.services.users import (
     InvalidManagerError,
     create_user,
     list_users,
+    list_users_for_manager,
     update_user,
 )
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Maps crud_user.delete_with_policy outcomes to (status code, detail)
+_DELETE_POLICY_ERRORS = {
+    "not_found": (status.HTTP_404_NOT_FOUND, "User not found"),
+    "forbidden_cross_tenant": (
+        status.HTTP_403_FORBIDDEN,
+        "Access denied: User belongs to different tenant",
+    ),
+    "forbidden_super_admin": (
+        status.HTTP_403_FORBIDDEN,
+        "Cannot delete Super Admin users",
+    ),
+    "forbidden_role": (
+        status.HTTP_403_FORBIDDEN,
+        "Managers can only delete cashiers",
+    ),
+    "forbidden_store": (
+        status.HTTP_403_FORBIDDEN,
+        "Managers can only delete cashiers from their assigned store",
+    ),
+    "forbidden_self": (
+        status.HTTP_403_FORBIDDEN,
+        "Cannot delete your own account",
+    ),
+}
+
+
+def to_response(user: User) -> UserResponse:
+    """Build a UserResponse from a trusted ORM row without re-validating it."""
+    return UserResponse.model_construct(
+        id=user.id,
+        name=user.name,
+        email=user.email,
+        role=user.role,
+        status=user.status,
+        store_id=user.store_id,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+
+
+def _list_response(users: Sequence[User]) -> ORJSONResponse:
+    # Returning a response directly skips FastAPI's response_model validation
+    return ORJSONResponse([to_response(user).model_dump() for user in users])
+
 
 @router.get("/me", response_model=UserResponse)
 def get_current_user_profile(
@@ -34,42 +81,43 @@ def get_current_user_profile(
     return UserResponse.model_validate(current_user)
 
 
-@router.get("/", response_model=list[UserResponse])
+@router.get("/", response_model=list[UserResponse], response_class=ORJSONResponse)
 def get_users(
     current_user: User = Depends(require_manager),
     session: Session = Depends(get_db_session),
     tenant_id: UUID = Depends(get_tenant_id),
     store_id: UUID | None = Query(None, description="Filter by store ID"),
     role: str | None = Query(None, description="Filter by role"),
-) -> Sequence[User]:
+) -> ORJSONResponse:
     """
     Get users based on role:
     - Super Admin: All users in tenant
     - Manager: Users in their assigned stores
     """
     if current_user.role == "super_admin":
-        # Super admin can see all users with optional filters
-        return list_users(
+        # Super admin can see all users with optional filters; read-only
+        # listing, so plain rows are enough
+        rows = crud_user.list_users_summary(
             session,
             tenant_id=tenant_id,
             store_id=store_id,
             role=role,
         )
+        return ORJSONResponse([dict(row) for row in rows])
     elif current_user.role == "manager":
-        # Manager can only see users in their assigned stores
-        # For now, get all users in tenant and filter by manager's stores
-        all_users = list_users(session, tenant_id=tenant_id, role=role)
-
-        # Filter to show only cashiers assigned to this manager and the manager themselves
-        filtered_users = [
-            user for user in all_users
-            if (user.role == "manager" and user.id == current_user.id) or
-               (user.role == "cashier" and user.store_id == current_user.store_id)
-        ]
-        return filtered_users
+        # Manager can only see cashiers in their store and themselves
+        users = list_users_for_manager(
+            session,
+            tenant_id=tenant_id,
+            manager_id=current_user.id,
+            store_id=current_user.store_id,
+            role=role,
+        )
     else:
         # Cashiers can only see themselves
-        return [current_user]
+        users = [current_user]
+
+    return _list_response(users)
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -137,8 +185,7 @@ def update_user_endpoint(
         # Role-based validation
         if current_user.role == "manager":
             # Get the user to be updated
-            from app.crud.crud_user import crud_user
-            target_user =  crud_user.get(session, id=user_id)
+            target_user = crud_user.get(session, id=user_id)
 
             if not target_user:
                 raise HTTPException(status_code=404, detail="User not found")
@@ -167,13 +214,17 @@ def update_user_endpoint(
     return user
 
 
-@router.get("/store/{store_id}", response_model=list[UserResponse])
+@router.get(
+    "/store/{store_id}",
+    response_model=list[UserResponse],
+    response_class=ORJSONResponse,
+)
 def get_users_by_store(
     store_id: UUID,
     current_user: User = Depends(require_manager),
     session: Session = Depends(get_db_session),
     tenant_id: UUID = Depends(get_tenant_id),
-) -> Sequence[User]:
+) -> ORJSONResponse:
     """
     Get users for a specific store based on role:
     - Super Admin: Can see users for any store
@@ -188,7 +239,9 @@ def get_users_by_store(
                 detail="You can only access users from your assigned store"
             )
 
-    return list_users(session, tenant_id=tenant_id, store_id=store_id)
+    return _list_response(
+        list_users(session, tenant_id=tenant_id, store_id=store_id)
+    )
 
 
 @router.get("/managers", response_model=list[UserResponse])
@@ -216,61 +269,16 @@ def delete_user(
     - Managers can only delete cashiers assigned to their store
     The deletion cascades to related records like sessions.
     """
-    # Import CRUD user
-    from app.crud.crud_user import crud_user
-
-    # Prevent deletion of Super Admins
-    user_to_delete = crud_user.get(session, user_id)
-    if not user_to_delete:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-
-    if user_to_delete.tenant_id != tenant_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied: User belongs to different tenant"
-        )
-
-    if user_to_delete.role == "super_admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot delete Super Admin users"
-        )
-
-    # Role-based access control
-    if current_user.role == "manager":
-        # Managers can only delete cashiers
-        if user_to_delete.role != "cashier":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Managers can only delete cashiers"
-            )
-
-        # Managers can only delete cashiers from their store
-        if user_to_delete.store_id != current_user.store_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Managers can only delete cashiers from their assigned store"
-            )
-    elif current_user.role == "super_admin":
-        # Super Admins cannot delete other Super Admins (already checked above)
-        pass
-
-    # Prevent users from deleting themselves
-    if user_to_delete.id == current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot delete your own account"
-        )
-
-    # Delete the user using CRUD remove method
-    deleted_user = crud_user.remove(session, id=user_id, tenant_id=tenant_id)
-    if not deleted_user:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete user"
-        )
+    outcome = crud_user.delete_with_policy(
+        session,
+        target_id=user_id,
+        tenant_id=tenant_id,
+        actor_id=current_user.id,
+        actor_role=current_user.role,
+        actor_store_id=current_user.store_id,
+    )
+    if outcome in _DELETE_POLICY_ERRORS:
+        status_code, detail = _DELETE_POLICY_ERRORS[outcome]
+        raise HTTPException(status_code=status_code, detail=detail)
 
     return None
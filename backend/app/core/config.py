@@ -13,6 +13,13 @@ class Settings(BaseSettings):
     frontend_origins: List[str] = ["http://localhost:5173"]
 
     supabase_db_url: str
+    # Postgres max_connections must cover
+    # (db_pool_size + db_max_overflow) x worker processes; behind PgBouncer in
+    # transaction mode size against default_pool_size / app replicas instead
+    db_pool_size: int = 25
+    db_max_overflow: int = 25
+    db_pool_timeout_seconds: int = 5
+    db_pool_recycle_seconds: int = 1800
     supabase_service_role_key: str
     supabase_project_url: str
     supabase_products_bucket: str = "products"
@@ -26,6 +33,15 @@ class Settings(BaseSettings):
 
     razorpay_enable_validation: bool = True
 
+    sale_stats_cache_ttl_seconds: int = 30
+    tenant_settings_cache_ttl_seconds: int = 60
+    # Older tenant_product_stats snapshots are ignored in favour of live counts
+    product_stats_max_age_seconds: int = 600
+    # Log pool checkouts/checkins at DEBUG; SQL echo itself is development only
+    sqlalchemy_debug: bool = False
+    # Development only: warn when one request runs more SQL statements than this
+    dev_query_count_warning: int = 10
+
     def cors_origins_for_fastapi(self) -> List[str]:
         return self.frontend_origins
 
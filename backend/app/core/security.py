@@ -1,23 +1,52 @@
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Any, Dict, Optional
 from uuid import UUID
 
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from jose import JWTError, jwt
 
 from app.core.config import settings
 
+# Argon2id parameters are fixed once at import
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+
+def _is_bcrypt_hash(hashed_password: str) -> bool:
+    return hashed_password.startswith("$2")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    """Verify a plain password against an Argon2id or legacy bcrypt hash."""
+    if _is_bcrypt_hash(hashed_password):
+        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+    """Hash a password using Argon2id."""
+    return _password_hasher.hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a stored hash is legacy bcrypt or uses outdated Argon2 parameters."""
+    if _is_bcrypt_hash(hashed_password):
+        return True
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
+# Checked against when no user matches a login, so a failed lookup costs the
+# same hashing work as a wrong password and response timing does not reveal
+# whether an account exists
+DUMMY_PASSWORD_HASH = get_password_hash("fa-pos-dummy-password")
 
 
 def create_access_token(
@@ -26,10 +55,14 @@ def create_access_token(
     tenant_id: Optional[UUID] = None
 ) -> str:
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
+    ttl_seconds = (
+        int(expires_delta.total_seconds())
+        if expires_delta
+        else settings.access_token_expire_minutes * 60
+    )
 
     # Add tenant_id to token if provided
-    token_data = {"exp": expire}
+    token_data = {"exp": int(time.time()) + ttl_seconds}
     if tenant_id:
         token_data["tenant_id"] = str(tenant_id)
 
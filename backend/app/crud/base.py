@@ -215,9 +215,19 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             else:
                 update_data = obj_in.dict(exclude_unset=True)
 
-            for field in obj_data:
-                if field in update_data:
-                    setattr(db_obj, field, update_data[field])
+            changed = {
+                field: update_data[field]
+                for field in obj_data
+                if field in update_data
+                and getattr(db_obj, field) != update_data[field]
+            }
+
+            # Nothing to write: skip the UPDATE and refresh round trips
+            if not changed:
+                return db_obj
+
+            for field, value in changed.items():
+                setattr(db_obj, field, value)
 
             db.add(db_obj)
             db.commit()
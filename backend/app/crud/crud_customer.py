@@ -2,10 +2,11 @@
 CRUD operations for Customer model.
 """
 
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, List, Mapping, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import Float, cast, select, func, and_, exists, lambda_stmt, tuple_
 from sqlalchemy.orm import Session
 
 from app.crud.base import CRUDBase
@@ -16,6 +17,9 @@ from app.schemas.customer import CustomerCreate, CustomerUpdate
 class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
     """
     CRUD operations for Customer model with multi-tenant support.
+
+    Phone lookups are built with lambda_stmt, which caches the compiled SQL
+    so only the parameters change per call.
     """
 
     def get_by_phone(
@@ -38,12 +42,15 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
         Returns:
             Customer instance or None if not found
         """
-        conditions = [Customer.phone == phone, Customer.tenant_id == tenant_id]
+        query = lambda_stmt(
+            lambda: select(Customer).where(
+                Customer.phone == phone, Customer.tenant_id == tenant_id
+            )
+        )
         if store_id:
-            conditions.append(Customer.store_id == store_id)
+            query += lambda s: s.where(Customer.store_id == store_id)
 
-        query = select(Customer).where(and_(*conditions))
-        result =  db.execute(query)
+        result = db.execute(query)
         return result.scalar_one_or_none()
 
     def phone_exists(
@@ -68,18 +75,20 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
         Returns:
             True if phone number exists, False otherwise
         """
-        conditions = [Customer.phone == phone, Customer.tenant_id == tenant_id]
+        # Only existence matters, so stop at the first matching row
+        query = lambda_stmt(
+            lambda: select(1).where(
+                Customer.phone == phone, Customer.tenant_id == tenant_id
+            )
+        )
         if store_id:
-            conditions.append(Customer.store_id == store_id)
-
-        query = select(func.count(Customer.id)).where(and_(*conditions))
-
+            query += lambda s: s.where(Customer.store_id == store_id)
         if exclude_customer_id:
-            query = query.where(Customer.id != exclude_customer_id)
+            query += lambda s: s.where(Customer.id != exclude_customer_id)
+        query += lambda s: s.limit(1)
 
-        result =  db.execute(query)
-        count = result.scalar()
-        return count > 0
+        result = db.execute(query)
+        return result.first() is not None
 
     def search_customers(
         self,
@@ -89,7 +98,8 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
         tenant_id: UUID,
         store_id: Optional[UUID] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Customer]:
         """
         Search customers by name or phone number.
@@ -99,22 +109,31 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
             search_term: Search term
             tenant_id: Tenant ID
             store_id: Optional store ID for multi-store filtering
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum number of records to return
+            after: (created_at, id) of the last customer from the previous page;
+                continues from there instead of using OFFSET
 
         Returns:
             List of matching customer instances
         """
         search_pattern = f"%{search_term}%"
+        name_pattern = func.lower(func.public.f_unaccent(search_pattern))
         conditions = [
             Customer.tenant_id == tenant_id,
-            Customer.name.ilike(search_pattern) | Customer.phone.ilike(f"%{search_term}%")
+            Customer.name_search.like(name_pattern) | Customer.phone.ilike(search_pattern)
         ]
         if store_id:
             conditions.append(Customer.store_id == store_id)
 
+        if after:
+            conditions.append(tuple_(Customer.created_at, Customer.id) < tuple_(*after))
+            skip = 0
+
         query = select(Customer).where(and_(*conditions))
-        query = query.offset(skip).limit(limit).order_by(Customer.created_at.desc())
+        query = query.offset(skip).limit(limit).order_by(
+            Customer.created_at.desc(), Customer.id.desc()
+        )
         result =  db.execute(query)
         return result.scalars().all()
 
@@ -167,8 +186,6 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
         Returns:
             List of recent customer instances
         """
-        from datetime import datetime, timedelta
-
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         query = select(Customer).where(
             and_(
@@ -188,7 +205,7 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
         tenant_id: UUID,
         skip: int = 0,
         limit: int = 100
-    ) -> List[dict]:
+    ) -> List[Mapping[str, Any]]:
         """
         Get customers with their sales count.
 
@@ -199,36 +216,40 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
             limit: Maximum number of records to return
 
         Returns:
-            List of customers with sales count
+            List of dicts with customer id, name, phone, sales_count
+            and total_spent
         """
         from app.models.sale import Sale
 
-        query = select(
-            Customer,
+        # Aggregate sales per customer first, then join the narrow result
+        sales_agg = select(
+            Sale.customer_id,
             func.count(Sale.id).label('sales_count'),
             func.sum(Sale.total).label('total_spent')
+        ).where(
+            and_(Sale.tenant_id == tenant_id, Sale.customer_id.isnot(None))
+        ).group_by(
+            Sale.customer_id
+        ).subquery()
+
+        sales_count = func.coalesce(sales_agg.c.sales_count, 0)
+        query = select(
+            Customer.id,
+            Customer.name,
+            Customer.phone,
+            sales_count.label('sales_count'),
+            cast(func.coalesce(sales_agg.c.total_spent, 0), Float).label('total_spent')
         ).outerjoin(
-            Sale, Customer.id == Sale.customer_id
+            sales_agg, Customer.id == sales_agg.c.customer_id
         ).where(
             Customer.tenant_id == tenant_id
-        ).group_by(
-            Customer.id
         ).order_by(
-            func.count(Sale.id).desc()
+            sales_count.desc()
         ).offset(skip).limit(limit)
 
-        result =  db.execute(query)
-        customers_data = []
-
-        for row in result:
-            customer_data = {
-                "customer": row.Customer,
-                "sales_count": row.sales_count or 0,
-                "total_spent": float(row.total_spent or 0)
-            }
-            customers_data.append(customer_data)
-
-        return customers_data
+        # Plain column rows; no ORM hydration for dashboard listings
+        result = db.execute(query)
+        return result.mappings().all()
 
     def get_top_customers(
         self,
@@ -236,7 +257,7 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
         *,
         tenant_id: UUID,
         limit: int = 10
-    ) -> List[dict]:
+    ) -> List[Mapping[str, Any]]:
         """
         Get top customers by total spending.
 
@@ -246,39 +267,43 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
             limit: Maximum number of records to return
 
         Returns:
-            List of top customers
+            List of dicts with customer id, name, phone, sales_count
+            and total_spent
         """
         from app.models.sale import Sale
 
-        query = select(
-            Customer,
+        # Aggregate completed sales per customer first, then join the top rows
+        sales_agg = select(
+            Sale.customer_id,
             func.count(Sale.id).label('sales_count'),
             func.sum(Sale.total).label('total_spent')
-        ).join(
-            Sale, Customer.id == Sale.customer_id
         ).where(
             and_(
-                Customer.tenant_id == tenant_id,
+                Sale.tenant_id == tenant_id,
+                Sale.customer_id.isnot(None),
                 Sale.status == "completed"
             )
         ).group_by(
-            Customer.id
+            Sale.customer_id
+        ).subquery()
+
+        query = select(
+            Customer.id,
+            Customer.name,
+            Customer.phone,
+            sales_agg.c.sales_count,
+            cast(sales_agg.c.total_spent, Float).label('total_spent')
+        ).join(
+            sales_agg, Customer.id == sales_agg.c.customer_id
+        ).where(
+            Customer.tenant_id == tenant_id
         ).order_by(
-            func.sum(Sale.total).desc()
+            sales_agg.c.total_spent.desc()
         ).limit(limit)
 
-        result =  db.execute(query)
-        top_customers = []
-
-        for row in result:
-            customer_data = {
-                "customer": row.Customer,
-                "sales_count": row.sales_count or 0,
-                "total_spent": float(row.total_spent or 0)
-            }
-            top_customers.append(customer_data)
-
-        return top_customers
+        # Plain column rows; no ORM hydration for dashboard listings
+        result = db.execute(query)
+        return result.mappings().all()
 
     def get_customer_statistics(
         self,
@@ -298,37 +323,33 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
         """
         from app.models.sale import Sale
 
-        # Total customers
-        total_query = select(func.count(Customer.id)).where(Customer.tenant_id == tenant_id)
-        total_result =  db.execute(total_query)
-        total_customers = total_result.scalar() or 0
+        cutoff_date = datetime.utcnow() - timedelta(days=30)
 
-        # Customers with sales
-        customers_with_sales_query = select(func.count(Customer.id.distinct())).join(
-            Sale, Customer.id == Sale.customer_id
-        ).where(
+        # A customer has sales if at least one completed sale references it;
+        # EXISTS stops at the first match instead of de-duplicating a join
+        has_completed_sale = exists().where(
             and_(
-                Customer.tenant_id == tenant_id,
+                Sale.customer_id == Customer.id,
                 Sale.status == "completed"
             )
         )
-        customers_with_sales_result =  db.execute(customers_with_sales_query)
-        customers_with_sales = customers_with_sales_result.scalar() or 0
-
-        # Customers without sales
-        customers_without_sales = total_customers - customers_with_sales
 
-        # Recent customers (last 30 days)
-        from datetime import datetime, timedelta
-        cutoff_date = datetime.utcnow() - timedelta(days=30)
-        recent_query = select(func.count(Customer.id)).where(
-            and_(
-                Customer.tenant_id == tenant_id,
+        # Total, recent (last 30 days) and with-sales counts in one round trip
+        query = select(
+            func.count(Customer.id).label("total_customers"),
+            func.count(Customer.id).filter(
+                has_completed_sale
+            ).label("customers_with_sales"),
+            func.count(Customer.id).filter(
                 Customer.created_at >= cutoff_date
-            )
-        )
-        recent_result =  db.execute(recent_query)
-        recent_customers = recent_result.scalar() or 0
+            ).label("recent_customers"),
+        ).where(Customer.tenant_id == tenant_id)
+
+        row = db.execute(query).one()
+        total_customers = row.total_customers or 0
+        customers_with_sales = row.customers_with_sales or 0
+        customers_without_sales = total_customers - customers_with_sales
+        recent_customers = row.recent_customers or 0
 
         return {
             "total_customers": total_customers,
@@ -2,20 +2,42 @@
 CRUD operations for Product model.
 """
 
-from typing import List, Optional
+from datetime import timedelta
+from typing import Iterator, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import (
+    select, update, func, and_, or_, bindparam, lambda_stmt, column, table
+)
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.crud.base import CRUDBase
 from app.models.product import Product
 from app.schemas.product import ProductCreate, ProductUpdate
+from app.utils.exceptions import InsufficientStockError
+
+
+# Per-tenant snapshot maintained by migrations/012_tenant_product_stats.sql
+tenant_product_stats = table(
+    "tenant_product_stats",
+    column("tenant_id"),
+    column("total_products"),
+    column("active_products"),
+    column("low_stock_products"),
+    column("out_of_stock_products"),
+    column("total_inventory_value"),
+    column("total_categories"),
+    column("refreshed_at"),
+)
 
 
 class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
     """
     CRUD operations for Product model with multi-tenant support.
+
+    SKU and barcode lookups and product search are built with lambda_stmt,
+    which caches the compiled SQL so only the parameters change per call.
     """
 
     def get_by_sku(
@@ -38,11 +60,14 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         Returns:
             Product instance or None if not found
         """
-        conditions = [Product.sku == sku, Product.tenant_id == tenant_id]
+        query = lambda_stmt(
+            lambda: select(Product).where(
+                Product.sku == sku, Product.tenant_id == tenant_id
+            )
+        )
         if store_id:
-            conditions.append(Product.store_id == store_id)
+            query += lambda s: s.where(Product.store_id == store_id)
 
-        query = select(Product).where(and_(*conditions))
         result = db.execute(query)
         return result.scalar_one_or_none()
 
@@ -66,11 +91,14 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         Returns:
             Product instance or None if not found
         """
-        conditions = [Product.barcode == barcode, Product.tenant_id == tenant_id]
+        query = lambda_stmt(
+            lambda: select(Product).where(
+                Product.barcode == barcode, Product.tenant_id == tenant_id
+            )
+        )
         if store_id:
-            conditions.append(Product.store_id == store_id)
+            query += lambda s: s.where(Product.store_id == store_id)
 
-        query = select(Product).where(and_(*conditions))
         result = db.execute(query)
         return result.scalar_one_or_none()
 
@@ -96,18 +124,20 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         Returns:
             True if SKU exists, False otherwise
         """
-        conditions = [Product.sku == sku, Product.tenant_id == tenant_id]
+        # Only existence matters, so stop at the first matching row
+        query = lambda_stmt(
+            lambda: select(1).where(
+                Product.sku == sku, Product.tenant_id == tenant_id
+            )
+        )
         if store_id:
-            conditions.append(Product.store_id == store_id)
-
-        query = select(func.count(Product.id)).where(and_(*conditions))
-
+            query += lambda s: s.where(Product.store_id == store_id)
         if exclude_product_id:
-            query = query.where(Product.id != exclude_product_id)
+            query += lambda s: s.where(Product.id != exclude_product_id)
+        query += lambda s: s.limit(1)
 
         result = db.execute(query)
-        count = result.scalar()
-        return count > 0
+        return result.first() is not None
 
     def barcode_exists(
         self,
@@ -134,18 +164,20 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         if not barcode:
             return False
 
-        conditions = [Product.barcode == barcode, Product.tenant_id == tenant_id]
+        # Only existence matters, so stop at the first matching row
+        query = lambda_stmt(
+            lambda: select(1).where(
+                Product.barcode == barcode, Product.tenant_id == tenant_id
+            )
+        )
         if store_id:
-            conditions.append(Product.store_id == store_id)
-
-        query = select(func.count(Product.id)).where(and_(*conditions))
-
+            query += lambda s: s.where(Product.store_id == store_id)
         if exclude_product_id:
-            query = query.where(Product.id != exclude_product_id)
+            query += lambda s: s.where(Product.id != exclude_product_id)
+        query += lambda s: s.limit(1)
 
         result = db.execute(query)
-        count = result.scalar()
-        return count > 0
+        return result.first() is not None
 
     def search_products(
         self,
@@ -171,19 +203,35 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         Returns:
             List of matching product instances
         """
+        # Scanner input is an exact barcode: try a btree equality lookup on
+        # (barcode, store_id) before falling back to the trigram search
+        if skip == 0 and search_term.isdigit() and len(search_term) >= 8:
+            conditions = [Product.barcode == search_term, Product.tenant_id == tenant_id]
+            if store_id:
+                conditions.append(Product.store_id == store_id)
+
+            query = select(Product).where(and_(*conditions)).limit(limit)
+            products = db.execute(query).scalars().all()
+            if products:
+                return products
+
         search_pattern = f"%{search_term}%"
-        conditions = [
-            Product.tenant_id == tenant_id,
-            Product.name.ilike(search_pattern) |
-            Product.sku.ilike(search_pattern) |
-            Product.barcode.ilike(search_pattern) |
-            Product.category.ilike(search_pattern)
-        ]
-        if store_id:
-            conditions.append(Product.store_id == store_id)
 
-        query = select(Product).where(and_(*conditions))
-        query = query.offset(skip).limit(limit).order_by(Product.name)
+        # One canonical statement for both the store-scoped and tenant-wide
+        # search: store_id is always bound and "IS NULL" disables the filter
+        store_param = bindparam("store_id", store_id, type_=Product.store_id.type)
+        query = lambda_stmt(
+            lambda: select(Product).where(
+                Product.tenant_id == tenant_id,
+                or_(store_param.is_(None), Product.store_id == store_param),
+                Product.name_search.like(
+                    func.lower(func.public.f_unaccent(search_pattern))
+                ) |
+                Product.sku.ilike(search_pattern) |
+                Product.barcode.ilike(search_pattern) |
+                Product.category.ilike(search_pattern)
+            ).order_by(Product.name).offset(skip).limit(limit)
+        )
         result = db.execute(query)
         return result.scalars().all()
 
@@ -243,10 +291,10 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
             conditions.append(Product.store_id == store_id)
 
         query = select(Product.category).where(and_(*conditions)).distinct()
+        query = query.order_by(Product.category)
 
         result = db.execute(query)
-        categories = [row[0] for row in result if row[0]]
-        return sorted(categories)
+        return [row[0] for row in result if row[0]]
 
     def get_products_by_store(
         self,
@@ -281,6 +329,40 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         result = db.execute(query)
         return result.scalars().all()
 
+    def iter_products_by_store(
+        self,
+        db: Session,
+        *,
+        store_id: UUID,
+        tenant_id: UUID,
+        status: Optional[str] = None,
+        batch_size: int = 200
+    ) -> Iterator[Product]:
+        """
+        Stream all products for a store without loading them into one list.
+
+        Rows are fetched from a server-side cursor in batches, so memory stays
+        bounded for exports and reports over large catalogs.
+
+        Args:
+            db: Database session
+            store_id: Store ID
+            tenant_id: Tenant ID
+            status: Optional status filter
+            batch_size: Number of rows fetched per round trip
+
+        Returns:
+            Iterator over product instances for the store
+        """
+        conditions = [Product.store_id == store_id, Product.tenant_id == tenant_id]
+        if status:
+            conditions.append(Product.status == status)
+
+        query = select(Product).where(and_(*conditions)).order_by(Product.name)
+        query = query.execution_options(yield_per=batch_size)
+        result = db.execute(query)
+        yield from result.scalars()
+
     def get_low_stock_products(
         self,
         db: Session,
@@ -371,16 +453,18 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         Returns:
             Updated product instance or None if not found
         """
-        query = select(Product).where(
-            and_(Product.id == product_id, Product.tenant_id == tenant_id)
+        query = (
+            update(Product)
+            .where(and_(Product.id == product_id, Product.tenant_id == tenant_id))
+            .values(stock=new_stock)
+            .returning(Product)
+            .execution_options(populate_existing=True)
         )
         result = db.execute(query)
         product = result.scalar_one_or_none()
 
         if product:
-            product.stock = new_stock
             db.commit()
-            db.refresh(product)
 
         return product
 
@@ -403,84 +487,109 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
 
         Returns:
             Updated product instance or None if not found
+
+        Raises:
+            InsufficientStockError: If the adjustment would make stock negative
         """
-        query = select(Product).where(
-            and_(Product.id == product_id, Product.tenant_id == tenant_id)
+        new_stock = func.coalesce(Product.stock, 0) + adjustment
+
+        # Guarded single UPDATE: the row lock serializes concurrent sales and
+        # the stock check happens at write time, so stock can never oversell
+        query = (
+            update(Product)
+            .where(
+                and_(
+                    Product.id == product_id,
+                    Product.tenant_id == tenant_id,
+                    new_stock >= 0
+                )
+            )
+            .values(stock=new_stock)
+            .returning(Product)
+            .execution_options(populate_existing=True)
         )
         result = db.execute(query)
         product = result.scalar_one_or_none()
 
         if product:
-            new_stock = max(0, product.stock + adjustment)  # Prevent negative stock
-            product.stock = new_stock
             db.commit()
-            db.refresh(product)
+            return product
 
-        return product
+        # Nothing updated: the product is missing or stock is too low
+        current = self.get(db, id=product_id, tenant_id=tenant_id)
+        if not current:
+            return None
+
+        raise InsufficientStockError(current.name, -adjustment, current.stock or 0)
 
     def get_product_statistics(
         self,
         db: Session,
         *,
-        tenant_id: UUID
+        tenant_id: UUID,
+        live: bool = False
     ) -> dict:
         """
         Get product statistics for a tenant.
 
+        Reads the tenant_product_stats snapshot unless live is set, the
+        tenant has no snapshot row yet, or the snapshot is older than
+        product_stats_max_age_seconds (e.g. the pg_cron refresh from
+        migrations/032 is not running).
+
         Args:
             db: Database session
             tenant_id: Tenant ID
+            live: Compute from the products table instead of the snapshot
 
         Returns:
             Dictionary with product statistics
         """
-        # Total products
-        total_query = select(func.count(Product.id)).where(Product.tenant_id == tenant_id)
-        total_result = db.execute(total_query)
-        total_products = total_result.scalar() or 0
-
-        # Active products
-        active_query = select(func.count(Product.id)).where(
-            and_(Product.tenant_id == tenant_id, Product.status == "active")
-        )
-        active_result = db.execute(active_query)
-        active_products = active_result.scalar() or 0
-
-        # Low stock products
-        low_stock_query = select(func.count(Product.id)).where(
-            and_(
-                Product.tenant_id == tenant_id,
-                Product.stock <= 5,
-                Product.status == "active"
+        if not live:
+            max_age = timedelta(seconds=settings.product_stats_max_age_seconds)
+            snapshot_query = select(tenant_product_stats).where(
+                tenant_product_stats.c.tenant_id == tenant_id,
+                tenant_product_stats.c.refreshed_at > func.now() - max_age
             )
-        )
-        low_stock_result = db.execute(low_stock_query)
-        low_stock_products = low_stock_result.scalar() or 0
-
-        # Out of stock products
-        out_of_stock_query = select(func.count(Product.id)).where(
-            and_(
-                Product.tenant_id == tenant_id,
-                Product.stock == 0,
-                Product.status == "active"
-            )
-        )
-        out_of_stock_result = db.execute(out_of_stock_query)
-        out_of_stock_products = out_of_stock_result.scalar() or 0
-
-        # Total inventory value
-        inventory_value_query = select(func.sum(Product.stock * Product.price)).where(
-            Product.tenant_id == tenant_id
-        )
-        inventory_value_result = db.execute(inventory_value_query)
-        total_inventory_value = float(inventory_value_result.scalar() or 0)
-
-        # Categories count
-        categories_query = select(func.count(func.distinct(Product.category))).where(
-            and_(Product.tenant_id == tenant_id, Product.category.isnot(None))
-        )
-        categories_result = db.execute(categories_query)
-        total_categories = categories_result.scalar() or 0
+            row = db.execute(snapshot_query).first()
+            if row:
+                return self._format_product_statistics(row)
+
+        active = Product.status == "active"
+
+        # Distinct categories via GROUP BY so the (tenant_id, category) index
+        # can be walked once per category instead of hashing every product
+        categories_query = select(func.count()).select_from(
+            select(Product.category).where(
+                and_(Product.tenant_id == tenant_id, Product.category.isnot(None))
+            ).group_by(Product.category).subquery()
+        ).scalar_subquery()
+
+        # All counters in a single scan of the tenant's products
+        query = select(
+            func.count(Product.id).label("total_products"),
+            func.count(Product.id).filter(active).label("active_products"),
+            func.count(Product.id).filter(
+                and_(active, Product.stock <= 5)
+            ).label("low_stock_products"),
+            func.count(Product.id).filter(
+                and_(active, Product.stock == 0)
+            ).label("out_of_stock_products"),
+            func.sum(Product.stock * Product.price).label("total_inventory_value"),
+            categories_query.label("total_categories"),
+        ).where(Product.tenant_id == tenant_id)
+
+        row = db.execute(query).one()
+        return self._format_product_statistics(row)
+
+    @staticmethod
+    def _format_product_statistics(row) -> dict:
+        total_products = row.total_products or 0
+        active_products = row.active_products or 0
+        low_stock_products = row.low_stock_products or 0
+        out_of_stock_products = row.out_of_stock_products or 0
+        total_inventory_value = float(row.total_inventory_value or 0)
+        total_categories = row.total_categories or 0
 
         return {
             "total_products": total_products,
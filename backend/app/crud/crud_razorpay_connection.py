@@ -1,11 +1,12 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import func, insert, literal, select, update
 from sqlalchemy.orm import Session
 
 from app.crud.base import CRUDBase
+from app.db.uuid7 import uuid7
 from app.models.razorpay_connection import RazorpayConnection
 from app.schemas.razorpay_connection import (
     RazorpayConnectionCreateRequest,
@@ -30,20 +31,31 @@ class CRUDRazorpayConnection(
         )
 
         if active_only:
+            # At most one active row per store (idx_razorpay_connections_active)
             query = query.where(self.model.is_active.is_(True))
+        else:
+            query = query.order_by(self.model.created_at.desc())
 
-        query = query.order_by(self.model.created_at.desc()).limit(1)
+        query = query.limit(1)
         result = db.execute(query)
         return result.scalar_one_or_none()
 
-    def deactivate_connections(
+    def rotate_connection(
         self,
         db: Session,
         *,
         tenant_id: UUID,
         store_id: UUID,
-    ) -> None:
-        stmt = (
+        new_values: Dict[str, Any],
+    ) -> RazorpayConnection:
+        """
+        Deactivate the store's active connections and insert the new one
+        in a single statement. The caller owns the transaction.
+        """
+        table = self.model.__table__
+        values = {"id": uuid7(), **new_values, "tenant_id": tenant_id, "store_id": store_id}
+
+        deactivated = (
             update(self.model)
             .where(
                 self.model.tenant_id == tenant_id,
@@ -51,9 +63,21 @@ class CRUDRazorpayConnection(
                 self.model.is_active.is_(True),
             )
             .values(is_active=False, replaced_at=datetime.utcnow())
+            .returning(self.model.id)
+            .cte("deactivated")
+        )
+
+        # Referencing the CTE makes Postgres run the UPDATE before the INSERT
+        new_row = select(
+            *(literal(value, table.c[key].type).label(key) for key, value in values.items())
+        ).where(select(func.count()).select_from(deactivated).scalar_subquery() >= 0)
+
+        stmt = (
+            insert(self.model)
+            .from_select(list(values), new_row)
+            .returning(self.model)
         )
-        db.execute(stmt)
-        db.commit()
+        return db.scalars(stmt).one()
 
 
 crud_razorpay_connection = CRUDRazorpayConnection(RazorpayConnection)
@@ -15,16 +15,19 @@ from app.schemas.razorpay_payment import (
 class CRUDRazorpayPayment(
     CRUDBase[RazorpayPayment, RazorpayOrderCreate, RazorpayPaymentUpdate]
 ):
-    def get_by_order_id(
+    def get_by_gateway_order_id(
         self,
         db: Session,
         *,
         order_id: str,
-        tenant_id: UUID | None = None,
     ) -> Optional[RazorpayPayment]:
+        """
+        Look up a payment by Razorpay order ID alone.
+
+        Only for the Razorpay callback, which arrives without a tenant
+        context; order IDs are globally unique (uq_razorpay_order_id).
+        """
         query = select(self.model).where(self.model.razorpay_order_id == order_id)
-        if tenant_id:
-            query = query.where(self.model.tenant_id == tenant_id)
         result = db.execute(query)
         return result.scalar_one_or_none()
 
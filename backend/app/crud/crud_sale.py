@@ -2,21 +2,114 @@
 CRUD operations for Sale model.
 """
 
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, desc
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    BigInteger, Float, select, func, and_, or_, desc, case, cast, insert, update, union_all,
+    tuple_, bindparam, column, table
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
 
+from app.core.config import settings
 from app.crud.base import CRUDBase
 from app.models.sale import Sale
 from app.schemas.sale import SaleCreate, SaleUpdate
+from app.utils.cache import TTLCache
+
+# Per-tenant daily totals maintained by migrations/016_sales_daily_rollup.sql
+sales_daily_rollup = table(
+    "sales_daily_rollup",
+    column("tenant_id"),
+    column("day"),
+    column("sales_count"),
+    column("revenue"),
+    column("discount"),
+)
+
+# Per-tenant daily product totals maintained by
+# migrations/019_product_daily_sales_rollup.sql
+product_daily_sales_rollup = table(
+    "product_daily_sales_rollup",
+    column("tenant_id"),
+    column("day"),
+    column("product_id"),
+    column("quantity"),
+    column("revenue"),
+)
+
+# Running per-tenant sale totals maintained by migrations/018_tenant_sales_counters.sql
+tenant_sales_counters = table(
+    "tenant_sales_counters",
+    column("tenant_id"),
+    column("sales_count"),
+)
+
+SALE_PERIODS = ("day", "week", "month")
+
+# SaleCreate fields that are not columns on the sales table
+SALE_INPUT_ONLY_FIELDS = {"items", "discount_type", "discount_value_input", "upi_status"}
+
+# Dashboard statistics tolerate a few seconds of staleness
+_sale_statistics_cache = TTLCache(ttl=settings.sale_stats_cache_ttl_seconds)
+
+
+def _period_start(period: str):
+    """Start of the current UTC day/week/month as a timestamptz expression."""
+    return func.timezone(
+        "UTC", func.date_trunc(period, func.timezone("UTC", func.now()))
+    )
+
+
+def _sales_page_statement(owner_column):
+    """Newest-first page of a tenant's sales for one customer or cashier."""
+    after_created_at = bindparam("after_created_at", type_=Sale.created_at.type)
+    after_id = bindparam("after_id", type_=Sale.id.type)
+    return (
+        select(Sale)
+        .options(selectinload(Sale.items))
+        .where(
+            and_(
+                owner_column == bindparam("owner_id", type_=owner_column.type),
+                Sale.tenant_id == bindparam("tenant_id", type_=Sale.tenant_id.type),
+                or_(
+                    after_created_at.is_(None),
+                    tuple_(Sale.created_at, Sale.id) < tuple_(after_created_at, after_id)
+                )
+            )
+        )
+        .order_by(desc(Sale.created_at), desc(Sale.id))
+        .offset(bindparam("skip"))
+        .limit(bindparam("limit"))
+    )
+
+
+# Hot-path statements built once at import; calls only bind parameters
+_SALE_BY_INVOICE = select(Sale).where(
+    and_(
+        Sale.invoice_no == bindparam("invoice_no", type_=Sale.invoice_no.type),
+        Sale.tenant_id == bindparam("tenant_id", type_=Sale.tenant_id.type)
+    )
+)
+_LATEST_INVOICE = (
+    select(Sale)
+    .where(Sale.tenant_id == bindparam("tenant_id", type_=Sale.tenant_id.type))
+    .order_by(desc(Sale.invoice_no))
+    .limit(1)
+)
+_SALES_BY_CUSTOMER = _sales_page_statement(Sale.customer_id)
+_SALES_BY_CASHIER = _sales_page_statement(Sale.cashier_id)
 
 
 class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
     """
     CRUD operations for Sale model with multi-tenant support.
+
+    List queries eager-load Sale.items with one extra SELECT ... IN per page,
+    so serializing a page of sales never lazy-loads items row by row.
     """
 
     def get_by_invoice_no(
@@ -37,12 +130,39 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         Returns:
             Sale instance or None if not found
         """
-        query = select(Sale).where(
-            and_(Sale.invoice_no == invoice_no, Sale.tenant_id == tenant_id)
+        result = db.execute(
+            _SALE_BY_INVOICE, {"invoice_no": invoice_no, "tenant_id": tenant_id}
         )
-        result = db.execute(query)
         return result.scalar_one_or_none()
 
+    def insert_if_invoice_free(
+        self,
+        db: Session,
+        *,
+        values: Dict[str, Any]
+    ) -> Optional[Sale]:
+        """
+        Insert a sale unless its invoice number is already used by the tenant.
+
+        Uses INSERT ... ON CONFLICT (invoice_no, tenant_id) DO NOTHING, so the
+        uniqueness check and the insert are one atomic round-trip. Does not
+        commit.
+
+        Args:
+            db: Database session
+            values: Sale column values, including tenant_id and invoice_no
+
+        Returns:
+            The inserted sale, or None if the invoice number is taken
+        """
+        stmt = (
+            pg_insert(Sale)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[Sale.invoice_no, Sale.tenant_id])
+            .returning(Sale)
+        )
+        return db.scalars(stmt).first()
+
     def create_with_items(
         self,
         db: Session,
@@ -66,40 +186,74 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         """
         try:
             # Extract sale data
-            sale_data = obj_in.dict(exclude={"items"})
+            sale_data = obj_in.model_dump(exclude=SALE_INPUT_ONLY_FIELDS)
             sale_data["tenant_id"] = tenant_id
 
-            # Create sale
-            db_sale = Sale(**sale_data)
-            db.add(db_sale)
+            # Create sale; a taken invoice number fails here instead of racing
+            # a separate get_by_invoice_no check
+            db_sale = self.insert_if_invoice_free(db, values=sale_data)
+            if db_sale is None:
+                raise ValueError(f"Invoice number {obj_in.invoice_no} already exists")
 
             # Add items if provided
             if obj_in.items:
                 from app.models.sale_item import SaleItem
-                from app.crud.crud_product import crud_product
-
+                from app.models.product import Product
+                from app.crud.crud_sale_item import crud_sale_item
+
+                # executemany form: insertmanyvalues sends the lines as one
+                # multi-row INSERT and the statement stays cached across
+                # invoices of different sizes
+                rows = crud_sale_item.build_rows(
+                    obj_in.items, sale_id=db_sale.id, tenant_id=tenant_id
+                )
+                db.execute(insert(SaleItem), rows)
+
+                requested: dict[UUID, int] = defaultdict(int)
                 for item_data in obj_in.items:
-                    # Create sale item
-                    item_dict = item_data.dict()
-                    item_dict["tenant_id"] = tenant_id
-                    db_item = SaleItem(**item_dict, sale_id=db_sale.id)
-                    db.add(db_item)
-
-                    # Update product stock
                     if item_data.product_id:
-                        product = crud_product.get(
-                            db, id=item_data.product_id, tenant_id=tenant_id
+                        requested[item_data.product_id] += item_data.quantity
+
+                if requested:
+                    # Lock every product on the invoice once and validate stock
+                    locked = db.execute(
+                        select(Product.id, Product.name, Product.stock)
+                        .where(
+                            and_(
+                                Product.id.in_(requested),
+                                Product.tenant_id == tenant_id
+                            )
+                        )
+                        .with_for_update()
+                    ).all()
+                    for product_id, name, stock in locked:
+                        if (stock or 0) - requested[product_id] < 0:
+                            raise ValueError(f"Insufficient stock for product {name}")
+
+                    # Deduct all quantities in a single UPDATE
+                    found_ids = [row.id for row in locked]
+                    if found_ids:
+                        deduction = case(
+                            {product_id: requested[product_id] for product_id in found_ids},
+                            value=Product.id
                         )
-                        if product:
-                            new_stock = product.stock - item_data.quantity
-                            if new_stock < 0:
-                                raise ValueError(f"Insufficient stock for product {product.name}")
-                            crud_product.update_stock(
-                                db, product_id=item_data.product_id,
-                                new_stock=new_stock, tenant_id=tenant_id
+                        updated = db.execute(
+                            update(Product)
+                            .where(
+                                and_(
+                                    Product.id.in_(found_ids),
+                                    Product.tenant_id == tenant_id
+                                )
                             )
+                            .values(stock=func.coalesce(Product.stock, 0) - deduction)
+                            .returning(Product.id)
+                            .execution_options(synchronize_session=False)
+                        ).scalars().all()
+                        if len(updated) != len(found_ids):
+                            raise ValueError("Stock update did not match the locked products")
 
             db.commit()
+            self.invalidate_statistics(tenant_id)
             db.refresh(db_sale)
             return db_sale
 
@@ -114,7 +268,8 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         customer_id: UUID,
         tenant_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Sale]:
         """
         Get sales by customer.
@@ -123,18 +278,23 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
             db: Database session
             customer_id: Customer ID
             tenant_id: Tenant ID
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum number of records to return
+            after: (created_at, id) of the last sale from the previous page;
+                continues from there instead of using OFFSET
 
         Returns:
             List of sale instances
         """
-        query = select(Sale).where(
-            and_(Sale.customer_id == customer_id, Sale.tenant_id == tenant_id)
-        )
-
-        query = query.offset(skip).limit(limit).order_by(desc(Sale.created_at))
-        result = db.execute(query)
+        params = {
+            "owner_id": customer_id,
+            "tenant_id": tenant_id,
+            "after_created_at": after[0] if after else None,
+            "after_id": after[1] if after else None,
+            "skip": 0 if after else skip,
+            "limit": limit,
+        }
+        result = db.execute(_SALES_BY_CUSTOMER, params)
         return result.scalars().all()
 
     def get_by_cashier(
@@ -144,7 +304,8 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         cashier_id: UUID,
         tenant_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Sale]:
         """
         Get sales by cashier.
@@ -153,18 +314,23 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
             db: Database session
             cashier_id: Cashier ID
             tenant_id: Tenant ID
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum number of records to return
+            after: (created_at, id) of the last sale from the previous page;
+                continues from there instead of using OFFSET
 
         Returns:
             List of sale instances
         """
-        query = select(Sale).where(
-            and_(Sale.cashier_id == cashier_id, Sale.tenant_id == tenant_id)
-        )
-
-        query = query.offset(skip).limit(limit).order_by(desc(Sale.created_at))
-        result = db.execute(query)
+        params = {
+            "owner_id": cashier_id,
+            "tenant_id": tenant_id,
+            "after_created_at": after[0] if after else None,
+            "after_id": after[1] if after else None,
+            "skip": 0 if after else skip,
+            "limit": limit,
+        }
+        result = db.execute(_SALES_BY_CASHIER, params)
         return result.scalars().all()
 
     def get_by_date_range(
@@ -183,7 +349,7 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         Args:
             db: Database session
             start_date: Start date
-            end_date: End date
+            end_date: End date (exclusive)
             tenant_id: Tenant ID
             skip: Number of records to skip
             limit: Maximum number of records to return
@@ -191,11 +357,11 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         Returns:
             List of sale instances
         """
-        query = select(Sale).where(
+        query = select(Sale).options(selectinload(Sale.items)).where(
             and_(
                 Sale.tenant_id == tenant_id,
                 Sale.created_at >= start_date,
-                Sale.created_at <= end_date
+                Sale.created_at < end_date
             )
         )
 
@@ -203,66 +369,116 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         result = db.execute(query)
         return result.scalars().all()
 
-    def get_today_sales(
+    def iter_by_date_range(
         self,
         db: Session,
         *,
-        tenant_id: UUID
-    ) -> List[Sale]:
+        start_date: datetime,
+        end_date: datetime,
+        tenant_id: UUID,
+        batch_size: int = 1000
+    ) -> Iterator[Sale]:
         """
-        Get today's sales for a tenant.
+        Stream sales within a date range without loading them into one list.
+
+        Rows are fetched from a server-side cursor in batches, and each
+        batch's items are eager-loaded with one SELECT ... IN, so memory stays
+        bounded for exports over long ranges.
 
         Args:
             db: Database session
+            start_date: Start date
+            end_date: End date (exclusive)
             tenant_id: Tenant ID
+            batch_size: Number of rows fetched per round trip
 
         Returns:
-            List of today's sale instances
+            Iterator over sale instances, newest first
         """
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = today_start + timedelta(days=1)
-
-        query = select(Sale).where(
+        query = select(Sale).options(selectinload(Sale.items)).where(
             and_(
                 Sale.tenant_id == tenant_id,
-                Sale.created_at >= today_start,
-                Sale.created_at < today_end
+                Sale.created_at >= start_date,
+                Sale.created_at < end_date
             )
         ).order_by(desc(Sale.created_at))
-
+        query = query.execution_options(yield_per=batch_size)
         result = db.execute(query)
-        return result.scalars().all()
+        yield from result.scalars()
 
-    def get_this_week_sales(
+    def get_sales_for_period(
         self,
         db: Session,
         *,
-        tenant_id: UUID
+        tenant_id: UUID,
+        period: str
     ) -> List[Sale]:
         """
-        Get this week's sales for a tenant.
+        Get a tenant's sales since the start of the current day, week or month.
+
+        The period start is computed in the database with date_trunc on the
+        current UTC time, so all three periods share one statement shape.
 
         Args:
             db: Database session
             tenant_id: Tenant ID
+            period: One of "day", "week" or "month"
 
         Returns:
-            List of this week's sale instances
+            List of sale instances for the period
+
+        Raises:
+            ValueError: If period is not supported
         """
-        today = datetime.utcnow().date()
-        week_start = today - timedelta(days=today.weekday())
-        week_start_datetime = datetime.combine(week_start, datetime.min.time())
+        if period not in SALE_PERIODS:
+            raise ValueError(f"Unsupported period: {period}")
 
-        query = select(Sale).where(
+        query = select(Sale).options(selectinload(Sale.items)).where(
             and_(
                 Sale.tenant_id == tenant_id,
-                Sale.created_at >= week_start_datetime
+                Sale.created_at >= _period_start(period)
             )
         ).order_by(desc(Sale.created_at))
 
         result = db.execute(query)
         return result.scalars().all()
 
+    def get_today_sales(
+        self,
+        db: Session,
+        *,
+        tenant_id: UUID
+    ) -> List[Sale]:
+        """
+        Get today's sales for a tenant.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+
+        Returns:
+            List of today's sale instances
+        """
+        return self.get_sales_for_period(db, tenant_id=tenant_id, period="day")
+
+    def get_this_week_sales(
+        self,
+        db: Session,
+        *,
+        tenant_id: UUID
+    ) -> List[Sale]:
+        """
+        Get this week's sales for a tenant.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+
+        Returns:
+            List of this week's sale instances
+        """
+        return self.get_sales_for_period(db, tenant_id=tenant_id, period="week")
+
     def get_this_month_sales(
         self,
         db: Session,
@@ -279,19 +495,7 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         Returns:
             List of this month's sale instances
         """
-        today = datetime.utcnow().date()
-        month_start = today.replace(day=1)
-        month_start_datetime = datetime.combine(month_start, datetime.min.time())
-
-        query = select(Sale).where(
-            and_(
-                Sale.tenant_id == tenant_id,
-                Sale.created_at >= month_start_datetime
-            )
-        ).order_by(desc(Sale.created_at))
-
-        result = db.execute(query)
-        return result.scalars().all()
+        return self.get_sales_for_period(db, tenant_id=tenant_id, period="month")
 
     def get_sales_summary(
         self,
@@ -307,70 +511,50 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         Args:
             db: Database session
             start_date: Start date
-            end_date: End date
+            end_date: End date (exclusive)
             tenant_id: Tenant ID
 
         Returns:
             Dictionary with sales summary
         """
-        # Total sales
-        total_sales_query = select(func.count(Sale.id)).where(
-            and_(
-                Sale.tenant_id == tenant_id,
-                Sale.created_at >= start_date,
-                Sale.created_at <= end_date
-            )
-        )
-        total_sales_result = db.execute(total_sales_query)
-        total_sales = total_sales_result.scalar() or 0
-
-        # Total revenue
-        total_revenue_query = select(func.sum(Sale.total)).where(
-            and_(
-                Sale.tenant_id == tenant_id,
-                Sale.created_at >= start_date,
-                Sale.created_at <= end_date
-            )
-        )
-        total_revenue_result = db.execute(total_revenue_query)
-        total_revenue = float(total_revenue_result.scalar() or 0)
-
-        # Total discount
-        total_discount_query = select(func.sum(Sale.discount)).where(
-            and_(
-                Sale.tenant_id == tenant_id,
-                Sale.created_at >= start_date,
-                Sale.created_at <= end_date
-            )
-        )
-        total_discount_result = db.execute(total_discount_query)
-        total_discount = float(total_discount_result.scalar() or 0)
-
-        # Average order value
-        average_order_value = total_revenue / total_sales if total_sales > 0 else 0
-
-        # Payment method breakdown
-        payment_breakdown_query = select(
+        # One range scan yields both the per-method rows and the grand total:
+        # GROUPING SETS ((payment_method), ()) adds a row where
+        # grouping(payment_method) = 1 holding the overall aggregates
+        query = select(
             Sale.payment_method,
+            func.grouping(Sale.payment_method).label('is_total'),
             func.count(Sale.id).label('count'),
-            func.sum(Sale.total).label('total')
+            func.sum(Sale.total).label('total'),
+            func.sum(Sale.discount).label('discount')
         ).where(
             and_(
                 Sale.tenant_id == tenant_id,
                 Sale.created_at >= start_date,
-                Sale.created_at <= end_date
+                Sale.created_at < end_date
             )
-        ).group_by(Sale.payment_method)
+        ).group_by(
+            func.grouping_sets(tuple_(Sale.payment_method), tuple_())
+        )
 
-        payment_breakdown_result = db.execute(payment_breakdown_query)
+        total_sales = 0
+        total_revenue = 0.0
+        total_discount = 0.0
         payment_breakdown = []
 
-        for row in payment_breakdown_result:
-            payment_breakdown.append({
-                "method": row.payment_method,
-                "count": row.count,
-                "total": float(row.total or 0)
-            })
+        for row in db.execute(query):
+            if row.is_total:
+                total_sales = row.count or 0
+                total_revenue = float(row.total or 0)
+                total_discount = float(row.discount or 0)
+            else:
+                payment_breakdown.append({
+                    "method": row.payment_method,
+                    "count": row.count,
+                    "total": float(row.total or 0)
+                })
+
+        # Average order value
+        average_order_value = total_revenue / total_sales if total_sales > 0 else 0
 
         return {
             "total_sales": total_sales,
@@ -388,14 +572,14 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         end_date: datetime,
         tenant_id: UUID,
         limit: int = 10
-    ) -> List[dict]:
+    ) -> List[Mapping[str, Any]]:
         """
         Get top selling products for a date range.
 
         Args:
             db: Database session
             start_date: Start date
-            end_date: End date
+            end_date: End date (exclusive)
             tenant_id: Tenant ID
             limit: Maximum number of products to return
 
@@ -405,39 +589,56 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         from app.models.sale_item import SaleItem
         from app.models.product import Product
 
-        query = select(
-            Product.id.label('product_id'),
-            Product.name.label('product_name'),
-            func.sum(SaleItem.quantity).label('total_quantity'),
-            func.sum(SaleItem.quantity * SaleItem.unit_price).label('total_revenue')
-        ).join(
-            SaleItem, Product.id == SaleItem.product_id
+        first_full_day, rollup_end = self._rollup_window(
+            db, product_daily_sales_rollup,
+            tenant_id=tenant_id, start_date=start_date, end_date=end_date
+        )
+
+        live_query = select(
+            SaleItem.product_id.label('product_id'),
+            func.sum(SaleItem.quantity).label('quantity'),
+            func.sum(SaleItem.line_total).label('revenue')
         ).join(
             Sale, SaleItem.sale_id == Sale.id
         ).where(
             and_(
                 Sale.tenant_id == tenant_id,
-                Sale.created_at >= start_date,
-                Sale.created_at <= end_date
+                self._live_range(start_date, end_date, first_full_day, rollup_end)
             )
+        ).group_by(SaleItem.product_id)
+
+        if rollup_end > first_full_day:
+            # Whole days come from the rollup, the edges from sale_items
+            rollup_query = select(
+                product_daily_sales_rollup.c.product_id,
+                product_daily_sales_rollup.c.quantity,
+                product_daily_sales_rollup.c.revenue
+            ).where(
+                and_(
+                    product_daily_sales_rollup.c.tenant_id == tenant_id,
+                    product_daily_sales_rollup.c.day >= first_full_day.date(),
+                    product_daily_sales_rollup.c.day < rollup_end.date()
+                )
+            )
+            sold = union_all(rollup_query, live_query).subquery()
+        else:
+            sold = live_query.subquery()
+
+        query = select(
+            Product.id.label('product_id'),
+            Product.name.label('product_name'),
+            cast(func.coalesce(func.sum(sold.c.quantity), 0), BigInteger).label('quantity'),
+            cast(func.coalesce(func.sum(sold.c.revenue), 0), Float).label('revenue')
+        ).join(
+            sold, Product.id == sold.c.product_id
         ).group_by(
             Product.id, Product.name
         ).order_by(
-            desc(func.sum(SaleItem.quantity))
+            desc(func.sum(sold.c.quantity))
         ).limit(limit)
 
         result = db.execute(query)
-        top_products = []
-
-        for row in result:
-            top_products.append({
-                "product_id": row.product_id,
-                "product_name": row.product_name,
-                "quantity": row.total_quantity or 0,
-                "revenue": float(row.total_revenue or 0)
-            })
-
-        return top_products
+        return result.mappings().all()
 
     def get_daily_sales_data(
         self,
@@ -446,44 +647,117 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         start_date: datetime,
         end_date: datetime,
         tenant_id: UUID
-    ) -> List[dict]:
+    ) -> List[Mapping[str, Any]]:
         """
         Get daily sales data for a date range.
 
+        Whole days already in the sales_daily_rollup snapshot are read from
+        it; partial days at the edges of the range and anything newer than
+        the snapshot are aggregated live from sales.
+
         Args:
             db: Database session
             start_date: Start date
-            end_date: End date
+            end_date: End date (exclusive)
             tenant_id: Tenant ID
 
         Returns:
             List of daily sales data
         """
-        query = select(
-            func.date(Sale.created_at).label('date'),
+        first_full_day, rollup_end = self._rollup_window(
+            db, sales_daily_rollup,
+            tenant_id=tenant_id, start_date=start_date, end_date=end_date
+        )
+
+        live_day = func.date(Sale.created_at)
+        live_query = select(
+            live_day.label('date'),
             func.count(Sale.id).label('sales_count'),
             func.sum(Sale.total).label('revenue')
         ).where(
             and_(
                 Sale.tenant_id == tenant_id,
-                Sale.created_at >= start_date,
-                Sale.created_at <= end_date
+                self._live_range(start_date, end_date, first_full_day, rollup_end)
             )
-        ).group_by(
-            func.date(Sale.created_at)
-        ).order_by('date')
+        ).group_by(live_day)
+
+        if rollup_end > first_full_day:
+            # Whole days come from the rollup, the edges from sales
+            rollup_query = select(
+                sales_daily_rollup.c.day.label('date'),
+                sales_daily_rollup.c.sales_count,
+                sales_daily_rollup.c.revenue
+            ).where(
+                and_(
+                    sales_daily_rollup.c.tenant_id == tenant_id,
+                    sales_daily_rollup.c.day >= first_full_day.date(),
+                    sales_daily_rollup.c.day < rollup_end.date()
+                )
+            )
+            days = union_all(rollup_query, live_query).subquery()
+        else:
+            days = live_query.subquery()
+
+        # Dates as ISO strings and revenue as float straight from SQL
+        query = select(
+            func.to_char(days.c.date, 'YYYY-MM-DD').label('date'),
+            days.c.sales_count,
+            cast(func.coalesce(days.c.revenue, 0), Float).label('revenue')
+        ).order_by(days.c.date)
 
         result = db.execute(query)
-        daily_data = []
+        return result.mappings().all()
+
+    @staticmethod
+    def _rollup_window(
+        db: Session,
+        rollup,
+        *,
+        tenant_id: UUID,
+        start_date: datetime,
+        end_date: datetime
+    ) -> tuple:
+        """
+        Split a date range into the whole days a daily rollup can answer.
 
-        for row in result:
-            daily_data.append({
-                "date": row.date.isoformat(),
-                "sales_count": row.sales_count,
-                "revenue": float(row.revenue or 0)
-            })
+        Returns (first_full_day, rollup_end): rollup rows with
+        first_full_day <= day < rollup_end cover the range; everything else
+        must be aggregated live. rollup_end <= first_full_day means the
+        rollup has nothing to contribute.
+        """
+        first_full_day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        if first_full_day < start_date:
+            first_full_day += timedelta(days=1)
+
+        last_rolled_up = db.execute(
+            select(func.max(rollup.c.day)).where(rollup.c.tenant_id == tenant_id)
+        ).scalar()
+        if last_rolled_up is None:
+            return first_full_day, first_full_day
+
+        rollup_end = min(
+            end_date.replace(hour=0, minute=0, second=0, microsecond=0),
+            datetime.combine(
+                last_rolled_up + timedelta(days=1), datetime.min.time(),
+                tzinfo=start_date.tzinfo
+            )
+        )
+        return first_full_day, rollup_end
 
-        return daily_data
+    @staticmethod
+    def _live_range(
+        start_date: datetime,
+        end_date: datetime,
+        first_full_day: datetime,
+        rollup_end: datetime
+    ):
+        """Sale.created_at predicate for the part of a range not in the rollup."""
+        if rollup_end <= first_full_day:
+            return and_(Sale.created_at >= start_date, Sale.created_at < end_date)
+        return or_(
+            and_(Sale.created_at >= start_date, Sale.created_at < first_full_day),
+            and_(Sale.created_at >= rollup_end, Sale.created_at < end_date)
+        )
 
     def get_sale_statistics(
         self,
@@ -494,6 +768,12 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         """
         Get overall sale statistics for a tenant.
 
+        total_sales comes from the trigger-maintained tenant_sales_counters
+        row instead of counting every sale; the today/week/month counts are
+        exact and only scan sales since the earlier of the week and month
+        start. Results are cached per tenant for
+        settings.sale_stats_cache_ttl_seconds.
+
         Args:
             db: Database session
             tenant_id: Tenant ID
@@ -501,44 +781,60 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         Returns:
             Dictionary with sale statistics
         """
-        # Total sales
-        total_query = select(func.count(Sale.id)).where(Sale.tenant_id == tenant_id)
-        total_result = db.execute(total_query)
-        total_sales = total_result.scalar() or 0
+        cached = _sale_statistics_cache.get(tenant_id)
+        if cached is not None:
+            return dict(cached)
+        # Read before querying so a write that lands meanwhile keeps this
+        # result out of the cache
+        generation = _sale_statistics_cache.generation(tenant_id)
 
-        # Today's sales
         today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_sales_query = select(func.count(Sale.id)).where(
-            and_(Sale.tenant_id == tenant_id, Sale.created_at >= today_start)
-        )
-        today_sales_result = db.execute(today_sales_query)
-        today_sales = today_sales_result.scalar() or 0
-
-        # This week's sales
-        today = datetime.utcnow().date()
+        today = today_start.date()
         week_start = today - timedelta(days=today.weekday())
         week_start_datetime = datetime.combine(week_start, datetime.min.time())
-        week_sales_query = select(func.count(Sale.id)).where(
-            and_(Sale.tenant_id == tenant_id, Sale.created_at >= week_start_datetime)
-        )
-        week_sales_result = db.execute(week_sales_query)
-        week_sales = week_sales_result.scalar() or 0
-
-        # This month's sales
         month_start = today.replace(day=1)
         month_start_datetime = datetime.combine(month_start, datetime.min.time())
-        month_sales_query = select(func.count(Sale.id)).where(
-            and_(Sale.tenant_id == tenant_id, Sale.created_at >= month_start_datetime)
+
+        total_query = select(tenant_sales_counters.c.sales_count).where(
+            tenant_sales_counters.c.tenant_id == tenant_id
+        ).scalar_subquery()
+
+        # One bounded range scan; each bucket is a FILTERed count
+        query = select(
+            total_query.label("total_sales"),
+            func.count().filter(Sale.created_at >= today_start).label("today_sales"),
+            func.count().filter(Sale.created_at >= week_start_datetime).label("week_sales"),
+            func.count().filter(Sale.created_at >= month_start_datetime).label("month_sales"),
+        ).where(
+            and_(
+                Sale.tenant_id == tenant_id,
+                Sale.created_at >= min(week_start_datetime, month_start_datetime)
+            )
         )
-        month_sales_result = db.execute(month_sales_query)
-        month_sales = month_sales_result.scalar() or 0
 
-        return {
+        row = db.execute(query).one()
+        total_sales = row.total_sales or 0
+        today_sales = row.today_sales or 0
+        week_sales = row.week_sales or 0
+        month_sales = row.month_sales or 0
+
+        statistics = {
             "total_sales": total_sales,
             "today_sales": today_sales,
             "week_sales": week_sales,
             "month_sales": month_sales,
         }
+        _sale_statistics_cache.set(tenant_id, statistics, generation=generation)
+        return dict(statistics)
+
+    def invalidate_statistics(self, tenant_id: UUID) -> None:
+        """
+        Drop the cached sale statistics for a tenant after a write.
+
+        Args:
+            tenant_id: Tenant ID
+        """
+        _sale_statistics_cache.delete(tenant_id)
 
     def get_sales_by_store(
         self,
@@ -548,7 +844,8 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         tenant_id: UUID,
         skip: int = 0,
         limit: int = 100,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Sale]:
         """
         Get sales for a specific store.
@@ -557,9 +854,11 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
             db: Database session
             store_id: Store ID
             tenant_id: Tenant ID
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum number of records to return
             status: Optional status filter
+            after: (created_at, id) of the last sale from the previous page;
+                continues from there instead of using OFFSET
 
         Returns:
             List of sale instances for the store
@@ -567,9 +866,12 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         conditions = [Sale.store_id == store_id, Sale.tenant_id == tenant_id]
         if status:
             conditions.append(Sale.status == status)
+        if after:
+            conditions.append(tuple_(Sale.created_at, Sale.id) < tuple_(*after))
+            skip = 0
 
-        query = select(Sale).where(and_(*conditions))
-        query = query.offset(skip).limit(limit).order_by(Sale.created_at.desc())
+        query = select(Sale).options(selectinload(Sale.items)).where(and_(*conditions))
+        query = query.offset(skip).limit(limit).order_by(Sale.created_at.desc(), Sale.id.desc())
         result = db.execute(query)
         return result.scalars().all()
 
@@ -590,7 +892,7 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
             store_id: Store ID
             tenant_id: Tenant ID
             start_date: Optional start date
-            end_date: Optional end date
+            end_date: Optional end date (exclusive)
 
         Returns:
             Dictionary with store sales summary
@@ -600,7 +902,7 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         if start_date:
             conditions.append(Sale.created_at >= start_date)
         if end_date:
-            conditions.append(Sale.created_at <= end_date)
+            conditions.append(Sale.created_at < end_date)
 
         # Total sales
         total_sales_query = select(func.count(Sale.id)).where(and_(*conditions))
@@ -629,13 +931,7 @@ class CRUDSale(CRUDBase[Sale, SaleCreate, SaleUpdate]):
         """
         Get the most recently created sale for a tenant.
         """
-        query = (
-            select(Sale)
-            .where(Sale.tenant_id == tenant_id)
-            .order_by(desc(Sale.invoice_no))
-            .limit(1)
-        )
-        result = db.execute(query)
+        result = db.execute(_LATEST_INVOICE, {"tenant_id": tenant_id})
         return result.scalar_one_or_none()
 
 
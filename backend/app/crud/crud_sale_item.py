@@ -5,7 +5,7 @@ CRUD operations for SaleItem model.
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, insert
 from sqlalchemy.orm import Session
 
 from app.crud.base import CRUDBase
@@ -38,7 +38,7 @@ class CRUDSaleItem(CRUDBase[SaleItem, SaleItemCreate, SaleItemUpdate]):
         """
         query = select(SaleItem).where(
             and_(SaleItem.sale_id == sale_id, SaleItem.tenant_id == tenant_id)
-        ).order_by(SaleItem.id)
+        ).order_by(SaleItem.pk_id)
 
         result = db.execute(query)
         return result.scalars().all()
@@ -50,7 +50,8 @@ class CRUDSaleItem(CRUDBase[SaleItem, SaleItemCreate, SaleItemUpdate]):
         product_id: UUID,
         tenant_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[UUID] = None
     ) -> List[SaleItem]:
         """
         Get sale items for a specific product.
@@ -59,19 +60,62 @@ class CRUDSaleItem(CRUDBase[SaleItem, SaleItemCreate, SaleItemUpdate]):
             db: Database session
             product_id: Product ID
             tenant_id: Tenant ID
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when cursor is given)
             limit: Maximum number of records to return
+            cursor: id of the last sale item from the previous page;
+                continues from there instead of using OFFSET
 
         Returns:
             List of sale item instances
         """
+        conditions = [SaleItem.product_id == product_id, SaleItem.tenant_id == tenant_id]
+        if cursor:
+            conditions.append(SaleItem.id < cursor)
+            skip = 0
+
         query = select(SaleItem).where(
-            and_(SaleItem.product_id == product_id, SaleItem.tenant_id == tenant_id)
+            and_(*conditions)
         ).offset(skip).limit(limit).order_by(SaleItem.id.desc())
 
         result = db.execute(query)
         return result.scalars().all()
 
+    def build_rows(
+        self,
+        items: List[SaleItemCreate],
+        *,
+        sale_id: UUID,
+        tenant_id: UUID
+    ) -> List[dict]:
+        """
+        Build column dictionaries for a multi-row sale item INSERT.
+
+        Args:
+            items: List of sale item creation data
+            sale_id: Sale ID
+            tenant_id: Tenant ID
+
+        Returns:
+            List of row dictionaries keyed by column name
+        """
+        # Plain attribute reads; no per-item model serialization
+        return [
+            {
+                "tenant_id": tenant_id,
+                "store_id": item_data.store_id,
+                "sale_id": sale_id,
+                "product_id": item_data.product_id,
+                "quantity": item_data.quantity,
+                "unit_price": item_data.unit_price,
+                # Calculate total if not provided
+                "total": (
+                    item_data.total if item_data.total is not None
+                    else item_data.quantity * item_data.unit_price
+                ),
+            }
+            for item_data in items
+        ]
+
     def create_batch(
         self,
         db: Session,
@@ -96,26 +140,12 @@ class CRUDSaleItem(CRUDBase[SaleItem, SaleItemCreate, SaleItemUpdate]):
             Exception: If database operation fails
         """
         try:
-            db_items = []
-            for item_data in items:
-                item_dict = item_data.dict()
-                item_dict["sale_id"] = sale_id
-                item_dict["tenant_id"] = tenant_id
-
-                # Calculate total if not provided
-                if "total" not in item_dict or item_dict["total"] is None:
-                    item_dict["total"] = item_dict["quantity"] * item_dict["unit_price"]
+            rows = self.build_rows(items, sale_id=sale_id, tenant_id=tenant_id)
 
-                db_item = SaleItem(**item_dict)
-                db_items.append(db_item)
-
-            db.add_all(db_items)
+            # Bulk INSERT ... RETURNING hands back populated instances in one round-trip
+            db_items = db.scalars(insert(SaleItem).returning(SaleItem), rows).all()
             db.commit()
 
-            # Refresh all items to get their IDs
-            for db_item in db_items:
-                db.refresh(db_item)
-
             return db_items
 
         except Exception as e:
@@ -2,20 +2,29 @@
 CRUD operations for Setting model.
 """
 
-from typing import Optional
+from typing import Any, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.crud.base import CRUDBase
 from app.models.setting import Setting
 from app.schemas.setting import SettingUpdate
+from app.utils.cache import TTLCache
+
+# Per-tenant snapshot of the settings read on most requests
+_tenant_settings_cache = TTLCache(ttl=settings.tenant_settings_cache_ttl_seconds, maxsize=2048)
 
 
 class CRUDSetting(CRUDBase[Setting, dict, SettingUpdate]):
     """
     CRUD operations for Setting model with multi-tenant support.
+
+    get_by_tenant runs on every settings read, so it is built with
+    lambda_stmt to reuse the compiled SQL between calls.
     """
 
     def get_by_tenant(
@@ -34,8 +43,8 @@ class CRUDSetting(CRUDBase[Setting, dict, SettingUpdate]):
         Returns:
             Setting instance or None if not found
         """
-        query = select(Setting).where(Setting.tenant_id == tenant_id)
-        result =  db.execute(query)
+        query = lambda_stmt(lambda: select(Setting).where(Setting.tenant_id == tenant_id))
+        result = db.execute(query)
         return result.scalar_one_or_none()
 
     def create_or_update(
@@ -56,45 +65,167 @@ class CRUDSetting(CRUDBase[Setting, dict, SettingUpdate]):
         Returns:
             Created or updated setting instance
         """
-        # Try to get existing settings
-        existing_setting = self.get_by_tenant(db, tenant_id=tenant_id)
-
-        if existing_setting:
-            # Update existing settings
-            update_data = {k: v for k, v in setting_data.items() if v is not None}
-            return self.update(db, db_obj=existing_setting, obj_in=update_data)
-        else:
-            # Create new settings
-            setting_data["tenant_id"] = tenant_id
-            return self.create(db, obj_in=setting_data)
+        values = {**setting_data, "tenant_id": tenant_id}
+        # Only non-None values overwrite an existing row; updated_at keeps
+        # the SET list non-empty when nothing else changes
+        update_data = {k: v for k, v in setting_data.items() if v is not None and k != "tenant_id"}
+
+        # One INSERT ... ON CONFLICT round trip instead of SELECT then INSERT/UPDATE
+        stmt = pg_insert(Setting).values(**values)
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[Setting.tenant_id],
+                set_={**{k: stmt.excluded[k] for k in update_data}, "updated_at": func.now()}
+            )
+            .returning(Setting)
+            .execution_options(populate_existing=True)
+        )
+        result = db.execute(stmt)
+        setting = result.scalar_one()
+        db.commit()
+
+        self.invalidate_cache(tenant_id)
+        return setting
 
-    def update_theme(
+    def bulk_upsert_settings(
+        self,
+        db: Session,
+        *,
+        rows: List[dict]
+    ) -> List[Setting]:
+        """
+        Create or overwrite settings for many tenants in one statement.
+
+        Every row must carry tenant_id and the same set of keys; on conflict
+        those columns replace the existing values. A later row for the same
+        tenant wins over an earlier one.
+
+        Args:
+            db: Database session
+            rows: Settings rows keyed by column name
+
+        Returns:
+            List of created or updated setting instances
+        """
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in a statement
+        by_tenant = {row["tenant_id"]: row for row in rows}
+        if not by_tenant:
+            return []
+
+        values = list(by_tenant.values())
+        stmt = pg_insert(Setting).values(values)
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[Setting.tenant_id],
+                set_={
+                    **{k: stmt.excluded[k] for k in values[0] if k != "tenant_id"},
+                    "updated_at": func.now()
+                }
+            )
+            .returning(Setting)
+            .execution_options(populate_existing=True)
+        )
+        settings_rows = db.scalars(stmt).all()
+        db.commit()
+
+        for tenant_id in by_tenant:
+            self.invalidate_cache(tenant_id)
+        return settings_rows
+
+    def _patch(
         self,
         db: Session,
         *,
         tenant_id: UUID,
-        theme: str
+        **fields: Any
     ) -> Optional[Setting]:
         """
-        Update the theme setting for a tenant.
+        Update the given setting fields in one UPDATE ... RETURNING.
+
+        None values are skipped so optional arguments leave columns untouched.
 
         Args:
             db: Database session
             tenant_id: Tenant ID
-            theme: Theme name (light, dark, etc.)
+            **fields: Column values to set
 
         Returns:
             Updated setting instance or None if not found
         """
-        setting = self.get_by_tenant(db, tenant_id=tenant_id)
+        values = {k: v for k, v in fields.items() if v is not None}
+        if not values:
+            return self.get_by_tenant(db, tenant_id=tenant_id)
+
+        query = (
+            update(Setting)
+            .where(Setting.tenant_id == tenant_id)
+            .values(**values)
+            .returning(Setting)
+            .execution_options(populate_existing=True)
+        )
+        result = db.execute(query)
+        setting = result.scalar_one_or_none()
 
         if setting:
-            setting.theme = theme
             db.commit()
-            db.refresh(setting)
+            self.invalidate_cache(tenant_id)
 
         return setting
 
+    def invalidate_cache(self, tenant_id: UUID) -> None:
+        """
+        Drop the cached settings snapshot for a tenant after a write.
+
+        Args:
+            tenant_id: Tenant ID
+        """
+        _tenant_settings_cache.delete(tenant_id)
+
+    def _cached_settings(self, db: Session, *, tenant_id: UUID) -> dict:
+        """
+        Return the frequently read setting fields for a tenant.
+
+        Served from an in-process TTL cache; on a miss the settings row is
+        loaded once and the fields are stored (an empty dict when the tenant
+        has no settings yet, so defaults are cached too).
+        """
+        cached = _tenant_settings_cache.get(tenant_id)
+        if cached is not None:
+            return cached
+
+        setting = self.get_by_tenant(db, tenant_id=tenant_id)
+        snapshot = {}
+        if setting:
+            snapshot = {
+                "currency_symbol": setting.currency_symbol,
+                "currency_code": setting.currency_code,
+                "tax_rate": setting.tax_rate,
+                "theme": setting.theme,
+                "low_stock_threshold": setting.low_stock_threshold,
+            }
+        _tenant_settings_cache.set(tenant_id, snapshot)
+        return snapshot
+
+    def update_theme(
+        self,
+        db: Session,
+        *,
+        tenant_id: UUID,
+        theme: str
+    ) -> Optional[Setting]:
+        """
+        Update the theme setting for a tenant.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID
+            theme: Theme name (light, dark, etc.)
+
+        Returns:
+            Updated setting instance or None if not found
+        """
+        return self._patch(db, tenant_id=tenant_id, theme=theme)
+
     def update_low_stock_threshold(
         self,
         db: Session,
@@ -113,14 +244,7 @@ class CRUDSetting(CRUDBase[Setting, dict, SettingUpdate]):
         Returns:
             Updated setting instance or None if not found
         """
-        setting = self.get_by_tenant(db, tenant_id=tenant_id)
-
-        if setting:
-            setting.low_stock_threshold = threshold
-            db.commit()
-            db.refresh(setting)
-
-        return setting
+        return self._patch(db, tenant_id=tenant_id, low_stock_threshold=threshold)
 
     def update_store_info(
         self,
@@ -148,23 +272,15 @@ class CRUDSetting(CRUDBase[Setting, dict, SettingUpdate]):
         Returns:
             Updated setting instance or None if not found
         """
-        setting = self.get_by_tenant(db, tenant_id=tenant_id)
-
-        if setting:
-            setting.store_name = store_name
-            if store_address is not None:
-                setting.store_address = store_address
-            if store_phone is not None:
-                setting.store_phone = store_phone
-            if store_email is not None:
-                setting.store_email = store_email
-            if store_logo_url is not None:
-                setting.store_logo_url = store_logo_url
-
-            db.commit()
-            db.refresh(setting)
-
-        return setting
+        return self._patch(
+            db,
+            tenant_id=tenant_id,
+            store_name=store_name,
+            store_address=store_address,
+            store_phone=store_phone,
+            store_email=store_email,
+            store_logo_url=store_logo_url
+        )
 
     def update_payment_settings(
         self,
@@ -188,20 +304,13 @@ class CRUDSetting(CRUDBase[Setting, dict, SettingUpdate]):
         Returns:
             Updated setting instance or None if not found
         """
-        setting = self.get_by_tenant(db, tenant_id=tenant_id)
-
-        if setting:
-            if upi_id is not None:
-                setting.upi_id = upi_id
-            if currency_symbol is not None:
-                setting.currency_symbol = currency_symbol
-            if currency_code is not None:
-                setting.currency_code = currency_code
-
-            db.commit()
-            db.refresh(setting)
-
-        return setting
+        return self._patch(
+            db,
+            tenant_id=tenant_id,
+            upi_id=upi_id,
+            currency_symbol=currency_symbol,
+            currency_code=currency_code
+        )
 
     def update_tax_rate(
         self,
@@ -221,14 +330,7 @@ class CRUDSetting(CRUDBase[Setting, dict, SettingUpdate]):
         Returns:
             Updated setting instance or None if not found
         """
-        setting = self.get_by_tenant(db, tenant_id=tenant_id)
-
-        if setting:
-            setting.tax_rate = tax_rate
-            db.commit()
-            db.refresh(setting)
-
-        return setting
+        return self._patch(db, tenant_id=tenant_id, tax_rate=tax_rate)
 
     def get_tenant_currency_info(
         self,
@@ -246,21 +348,14 @@ class CRUDSetting(CRUDBase[Setting, dict, SettingUpdate]):
         Returns:
             Dictionary with currency information
         """
-        setting = self.get_by_tenant(db, tenant_id=tenant_id)
+        setting = self._cached_settings(db, tenant_id=tenant_id)
 
-        if setting:
-            return {
-                "currency_symbol": setting.currency_symbol or "Rs.",
-                "currency_code": setting.currency_code or "INR",
-                "tax_rate": float(setting.tax_rate or 0),
-            }
-        else:
-            # Return default values
-            return {
-                "currency_symbol": "Rs.",
-                "currency_code": "INR",
-                "tax_rate": 0.0,
-            }
+        # Missing values fall back to the defaults
+        return {
+            "currency_symbol": setting.get("currency_symbol") or "Rs.",
+            "currency_code": setting.get("currency_code") or "INR",
+            "tax_rate": float(setting.get("tax_rate") or 0),
+        }
 
     def get_tenant_low_stock_threshold(
         self,
@@ -278,10 +373,10 @@ class CRUDSetting(CRUDBase[Setting, dict, SettingUpdate]):
         Returns:
             Low stock threshold value (default: 5)
         """
-        setting = self.get_by_tenant(db, tenant_id=tenant_id)
+        setting = self._cached_settings(db, tenant_id=tenant_id)
 
-        if setting and setting.low_stock_threshold is not None:
-            return setting.low_stock_threshold
+        if setting.get("low_stock_threshold") is not None:
+            return setting["low_stock_threshold"]
 
         return 5  # Default threshold
 
@@ -301,10 +396,10 @@ class CRUDSetting(CRUDBase[Setting, dict, SettingUpdate]):
         Returns:
             Theme name (default: "light")
         """
-        setting = self.get_by_tenant(db, tenant_id=tenant_id)
+        setting = self._cached_settings(db, tenant_id=tenant_id)
 
-        if setting and setting.theme:
-            return setting.theme
+        if setting.get("theme"):
+            return setting["theme"]
 
         return "light"  # Default theme
 
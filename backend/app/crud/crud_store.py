@@ -2,11 +2,12 @@
 CRUD operations for Store model.
 """
 
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Iterator, List, Mapping, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update, func, and_, or_, lambda_stmt, true, tuple_
+from sqlalchemy.orm import Session, raiseload
 
 from app.crud.base import CRUDBase
 from app.models.store import Store
@@ -14,12 +15,16 @@ from app.models.user import User
 from app.models.product import Product
 from app.models.sale import Sale
 from app.models.customer import Customer
+from app.models.sale_item import SaleItem
 from app.schemas.store import StoreCreate, StoreUpdate
 
 
 class CRUDStore(CRUDBase[Store, StoreCreate, StoreUpdate]):
     """
     CRUD operations for Store model with multi-tenant support.
+
+    get_by_name is built with lambda_stmt, so its compiled SQL is cached
+    across calls.
     """
 
     def get_by_name(
@@ -40,12 +45,12 @@ class CRUDStore(CRUDBase[Store, StoreCreate, StoreUpdate]):
         Returns:
             Store instance or None if not found
         """
-        query = select(Store).where(Store.name == name)
+        query = lambda_stmt(lambda: select(Store).where(Store.name == name))
 
         if tenant_id:
-            query = query.where(Store.tenant_id == tenant_id)
+            query += lambda s: s.where(Store.tenant_id == tenant_id)
 
-        result =  db.execute(query)
+        result = db.execute(query)
         return result.scalar_one_or_none()
 
     def get_multi(
@@ -55,22 +60,27 @@ class CRUDStore(CRUDBase[Store, StoreCreate, StoreUpdate]):
         skip: int = 0,
         limit: int = 100,
         tenant_id: Optional[UUID] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Store]:
         """
         Get multiple stores.
 
         Args:
             db: Database session
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum number of records to return
             tenant_id: Optional tenant ID for multi-tenant isolation
             status: Optional status to filter stores
+            after: (created_at, id) of the last store from the previous page;
+                continues from there instead of using OFFSET
 
         Returns:
             List of store instances
         """
-        query = select(Store)
+        # List responses only serialize store columns; fail loudly instead of
+        # lazy-loading a relationship once per row
+        query = select(Store).options(raiseload("*"))
 
         # Add tenant filtering
         if tenant_id:
@@ -80,18 +90,82 @@ class CRUDStore(CRUDBase[Store, StoreCreate, StoreUpdate]):
         if status:
             query = query.where(Store.status == status)
 
-        query = query.offset(skip).limit(limit).order_by(Store.created_at.desc())
+        if after:
+            query = query.where(tuple_(Store.created_at, Store.id) < tuple_(*after))
+            skip = 0
+
+        query = query.offset(skip).limit(limit).order_by(
+            Store.created_at.desc(), Store.id.desc()
+        )
 
         result =  db.execute(query)
         return result.scalars().all()
 
+    def get_multi_rows(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        tenant_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Mapping[str, Any]]:
+        """
+        Get multiple stores as plain rows for read-only listings.
+
+        Same filtering as get_multi, but only the columns the store response
+        needs are selected and no ORM instances are built or tracked.
+
+        Args:
+            db: Database session
+            skip: Number of records to skip (ignored when after is given)
+            limit: Maximum number of records to return
+            tenant_id: Optional tenant ID for multi-tenant isolation
+            status: Optional status to filter stores
+            after: (created_at, id) of the last store from the previous page;
+                continues from there instead of using OFFSET
+
+        Returns:
+            List of row mappings keyed by column name
+        """
+        query = select(
+            Store.id,
+            Store.tenant_id,
+            Store.name,
+            Store.address,
+            Store.phone,
+            Store.email,
+            Store.status,
+            Store.created_at,
+            Store.updated_at,
+        )
+
+        if tenant_id:
+            query = query.where(Store.tenant_id == tenant_id)
+
+        if status:
+            query = query.where(Store.status == status)
+
+        if after:
+            query = query.where(tuple_(Store.created_at, Store.id) < tuple_(*after))
+            skip = 0
+
+        query = query.offset(skip).limit(limit).order_by(
+            Store.created_at.desc(), Store.id.desc()
+        )
+
+        result = db.execute(query)
+        return result.mappings().all()
+
     def get_active_stores(
         self,
         db: Session,
         *,
         tenant_id: Optional[UUID] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Store]:
         """
         Get active stores.
@@ -99,22 +173,61 @@ class CRUDStore(CRUDBase[Store, StoreCreate, StoreUpdate]):
         Args:
             db: Database session
             tenant_id: Optional tenant ID for multi-tenant isolation
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum number of records to return
+            after: (created_at, id) of the last store from the previous page;
+                continues from there instead of using OFFSET
 
         Returns:
             List of active store instances
         """
-        query = select(Store).where(Store.status == "active")
+        query = select(Store).options(raiseload("*")).where(Store.status == "active")
 
         if tenant_id:
             query = query.where(Store.tenant_id == tenant_id)
 
-        query = query.offset(skip).limit(limit).order_by(Store.created_at.desc())
+        if after:
+            query = query.where(tuple_(Store.created_at, Store.id) < tuple_(*after))
+            skip = 0
+
+        query = query.offset(skip).limit(limit).order_by(
+            Store.created_at.desc(), Store.id.desc()
+        )
 
         result =  db.execute(query)
         return result.scalars().all()
 
+    def iter_stores(
+        self,
+        db: Session,
+        *,
+        tenant_id: Optional[UUID] = None,
+        batch_size: int = 500
+    ) -> Iterator[Store]:
+        """
+        Stream stores without loading them into one list.
+
+        Rows are fetched from a server-side cursor in batches, so memory stays
+        bounded for batch jobs that walk every store.
+
+        Args:
+            db: Database session
+            tenant_id: Optional tenant ID for multi-tenant isolation
+            batch_size: Number of rows fetched per round trip
+
+        Returns:
+            Iterator over store instances, newest first
+        """
+        query = select(Store).options(raiseload("*"))
+
+        if tenant_id:
+            query = query.where(Store.tenant_id == tenant_id)
+
+        query = query.order_by(Store.created_at.desc())
+        query = query.execution_options(yield_per=batch_size)
+        result = db.execute(query)
+        yield from result.scalars()
+
     def search_stores(
         self,
         db: Session,
@@ -137,11 +250,14 @@ class CRUDStore(CRUDBase[Store, StoreCreate, StoreUpdate]):
         Returns:
             List of matching store instances
         """
-        search_pattern = f"%{search_term}%"
-        query = select(Store).where(
-            and_(
-                Store.name.ilike(search_pattern) | Store.address.ilike(search_pattern)
-            )
+        # Treat LIKE wildcards in the term literally; backslash is the
+        # default LIKE escape character in PostgreSQL
+        escaped_term = (
+            search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        search_pattern = f"%{escaped_term}%"
+        query = select(Store).options(raiseload("*")).where(
+            or_(Store.name.ilike(search_pattern), Store.address.ilike(search_pattern))
         )
 
         if tenant_id:
@@ -172,7 +288,8 @@ class CRUDStore(CRUDBase[Store, StoreCreate, StoreUpdate]):
         Returns:
             True if name exists, False otherwise
         """
-        query = select(func.count(Store.id)).where(Store.name == name)
+        # Only existence matters, so stop at the first matching row
+        query = select(1).where(Store.name == name)
 
         if tenant_id:
             query = query.where(Store.tenant_id == tenant_id)
@@ -180,9 +297,8 @@ class CRUDStore(CRUDBase[Store, StoreCreate, StoreUpdate]):
         if exclude_store_id:
             query = query.where(Store.id != exclude_store_id)
 
-        result =  db.execute(query)
-        count = result.scalar()
-        return count > 0
+        result = db.execute(query.limit(1))
+        return result.first() is not None
 
     def get_store_statistics(
         self,
@@ -202,73 +318,61 @@ class CRUDStore(CRUDBase[Store, StoreCreate, StoreUpdate]):
         Returns:
             Dictionary with store statistics
         """
-        # Verify store exists and belongs to tenant if tenant_id provided
-        store = self.get(db, id=store_id, tenant_id=tenant_id)
-        if not store:
-            return {}
+        today_start = datetime.combine(datetime.now().date(), datetime.min.time())
+        today_end = today_start + timedelta(days=1)
+
+        def count_for(model):
+            return select(func.count(model.id)).where(
+                model.store_id == store_id
+            ).scalar_subquery()
+
+        is_today = and_(Sale.created_at >= today_start, Sale.created_at < today_end)
+
+        # Totals and today's figures come from one conditional aggregate per
+        # table instead of a separate scan for each
+        sales = select(
+            func.count(Sale.id).label("total_sales"),
+            func.count(Sale.id).filter(is_today).label("today_sales")
+        ).where(Sale.store_id == store_id).subquery()
+        revenue = select(
+            func.coalesce(func.sum(SaleItem.line_total), 0).label("total_revenue"),
+            func.coalesce(func.sum(SaleItem.line_total).filter(is_today), 0).label("today_revenue")
+        ).join(
+            Sale, SaleItem.sale_id == Sale.id
+        ).where(SaleItem.store_id == store_id).subquery()
+
+        # Everything is read in one statement over the store row, which also
+        # verifies the store exists and belongs to the tenant
+        query = select(
+            Store.name.label("store_name"),
+            count_for(Product).label("product_count"),
+            count_for(Customer).label("customer_count"),
+            count_for(User).label("user_count"),
+            sales.c.total_sales,
+            sales.c.today_sales,
+            revenue.c.total_revenue,
+            revenue.c.today_revenue,
+        ).select_from(Store).join(sales, true()).join(
+            revenue, true()
+        ).where(Store.id == store_id)
 
-        # Product count
-        product_query = select(func.count(Product.id)).where(Product.store_id == store_id)
-        product_result =  db.execute(product_query)
-        product_count = product_result.scalar() or 0
-
-        # Customer count
-        customer_query = select(func.count(Customer.id)).where(Customer.store_id == store_id)
-        customer_result =  db.execute(customer_query)
-        customer_count = customer_result.scalar() or 0
-
-        # User count (cashiers assigned to this store)
-        user_query = select(func.count(User.id)).where(User.store_id == store_id)
-        user_result =  db.execute(user_query)
-        user_count = user_result.scalar() or 0
-
-        # Sales data
-        sales_query = select(func.count(Sale.id)).where(Sale.store_id == store_id)
-        sales_result =  db.execute(sales_query)
-        total_sales = sales_result.scalar() or 0
-
-        # Today's sales
-        from datetime import datetime
-        today = datetime.now().date()
-        today_sales_query = select(func.count(Sale.id)).where(
-            and_(
-                Sale.store_id == store_id,
-                func.date(Sale.created_at) == today
-            )
-        )
-        today_sales_result =  db.execute(today_sales_query)
-        today_sales = today_sales_result.scalar() or 0
-
-        # Total revenue (this would need to be calculated from sale_items)
-        from app.models.sale_item import SaleItem
-        revenue_query = select(func.coalesce(func.sum(SaleItem.quantity * SaleItem.unit_price), 0)).where(
-            and_(
-                SaleItem.store_id == store_id
-            )
-        )
-        revenue_result =  db.execute(revenue_query)
-        total_revenue = float(revenue_result.scalar() or 0)
-
-        # Today's revenue
-        today_revenue_query = select(func.coalesce(func.sum(SaleItem.quantity * SaleItem.unit_price), 0)).where(
-            and_(
-                SaleItem.store_id == store_id,
-                func.date(SaleItem.created_at) == today
-            )
-        )
-        today_revenue_result =  db.execute(today_revenue_query)
-        today_revenue = float(today_revenue_result.scalar() or 0)
+        if tenant_id:
+            query = query.where(Store.tenant_id == tenant_id)
+
+        row = db.execute(query).first()
+        if not row:
+            return {}
 
         return {
             "store_id": store_id,
-            "store_name": store.name,
-            "product_count": product_count,
-            "customer_count": customer_count,
-            "user_count": user_count,
-            "total_sales": total_sales,
-            "today_sales": today_sales,
-            "total_revenue": total_revenue,
-            "today_revenue": today_revenue,
+            "store_name": row.store_name,
+            "product_count": row.product_count or 0,
+            "customer_count": row.customer_count or 0,
+            "user_count": row.user_count or 0,
+            "total_sales": row.total_sales or 0,
+            "today_sales": row.today_sales or 0,
+            "total_revenue": float(row.total_revenue or 0),
+            "today_revenue": float(row.today_revenue or 0),
         }
 
     
@@ -292,14 +396,19 @@ class CRUDStore(CRUDBase[Store, StoreCreate, StoreUpdate]):
         Returns:
             Updated store instance or None if not found
         """
-        store =  self.get(db, id=store_id, tenant_id=tenant_id)
-        if not store:
-            return None
-
-        store.status = status
-        db.add(store)
-        db.commit()
-        db.refresh(store)
+        # UPDATE ... RETURNING reads the new row back in the same round trip
+        query = update(Store).where(Store.id == store_id).values(status=status)
+
+        if tenant_id:
+            query = query.where(Store.tenant_id == tenant_id)
+
+        query = query.returning(Store).execution_options(populate_existing=True)
+        result = db.execute(query)
+        store = result.scalar_one_or_none()
+
+        if store:
+            db.commit()
+
         return store
 
 
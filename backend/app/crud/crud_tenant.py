@@ -2,11 +2,12 @@
 CRUD operations for Tenant model.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func, lambda_stmt, true, tuple_
+from sqlalchemy.orm import Session, raiseload
 
 from app.crud.base import CRUDBase
 from app.models.tenant import Tenant
@@ -16,6 +17,9 @@ from app.schemas.tenant import TenantCreate, TenantUpdate
 class CRUDTenant(CRUDBase[Tenant, TenantCreate, TenantUpdate]):
     """
     CRUD operations for Tenant model.
+
+    Domain and name lookups use lambda_stmt; the compiled SQL is cached and
+    only the parameters change per call.
     """
 
     def get_by_domain(
@@ -34,8 +38,8 @@ class CRUDTenant(CRUDBase[Tenant, TenantCreate, TenantUpdate]):
         Returns:
             Tenant instance or None if not found
         """
-        query = select(Tenant).where(Tenant.domain == domain)
-        result =  db.execute(query)
+        query = lambda_stmt(lambda: select(Tenant).where(Tenant.domain == domain))
+        result = db.execute(query)
         return result.scalar_one_or_none()
 
     def get_by_name(
@@ -54,8 +58,8 @@ class CRUDTenant(CRUDBase[Tenant, TenantCreate, TenantUpdate]):
         Returns:
             Tenant instance or None if not found
         """
-        query = select(Tenant).where(Tenant.name == name)
-        result =  db.execute(query)
+        query = lambda_stmt(lambda: select(Tenant).where(Tenant.name == name))
+        result = db.execute(query)
         return result.scalar_one_or_none()
 
     def get_active_tenants(
@@ -63,21 +67,30 @@ class CRUDTenant(CRUDBase[Tenant, TenantCreate, TenantUpdate]):
         db: Session,
         *,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Tenant]:
         """
         Get all active tenants.
 
         Args:
             db: Database session
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum number of records to return
+            after: (created_at, id) of the last tenant from the previous page;
+                continues from there instead of using OFFSET
 
         Returns:
             List of active tenant instances
         """
-        query = select(Tenant).where(Tenant.status == "active").offset(skip).limit(limit)
-        query = query.order_by(Tenant.created_at.desc())
+        query = select(Tenant).options(raiseload("*")).where(Tenant.status == "active")
+
+        if after:
+            query = query.where(tuple_(Tenant.created_at, Tenant.id) < tuple_(*after))
+            skip = 0
+
+        query = query.offset(skip).limit(limit)
+        query = query.order_by(Tenant.created_at.desc(), Tenant.id.desc())
         result =  db.execute(query)
         return result.scalars().all()
 
@@ -102,62 +115,132 @@ class CRUDTenant(CRUDBase[Tenant, TenantCreate, TenantUpdate]):
         from app.models.customer import Customer
         from app.models.sale import Sale
 
-        # Get tenant info
-        tenant =  self.get(db, id=tenant_id)
-        if not tenant:
+        # One aggregate pass per table; the one-row results are joined onto the
+        # tenant row so everything comes back in a single round-trip
+        users = select(
+            func.count(User.id).label("total_users"),
+            func.count(User.id).filter(User.status == "active").label("active_users")
+        ).where(User.tenant_id == tenant_id).subquery()
+        products = select(
+            func.count(Product.id).label("total_products"),
+            func.count(Product.id).filter(Product.status == "active").label("active_products")
+        ).where(Product.tenant_id == tenant_id).subquery()
+        customers = select(
+            func.count(Customer.id).label("total_customers")
+        ).where(Customer.tenant_id == tenant_id).subquery()
+        sales = select(
+            func.count(Sale.id).label("total_sales"),
+            func.coalesce(func.sum(Sale.total), 0).label("total_revenue")
+        ).where(Sale.tenant_id == tenant_id).subquery()
+
+        query = select(
+            Tenant.name,
+            users.c.total_users,
+            users.c.active_users,
+            products.c.total_products,
+            products.c.active_products,
+            customers.c.total_customers,
+            sales.c.total_sales,
+            sales.c.total_revenue
+        ).select_from(Tenant).join(users, true()).join(products, true()).join(
+            customers, true()
+        ).join(sales, true()).where(Tenant.id == tenant_id)
+
+        row = db.execute(query).first()
+        if not row:
             return {}
 
-        # Count users
-        user_count_query = select(func.count(User.id)).where(User.tenant_id == tenant_id)
-        user_count_result =  db.execute(user_count_query)
-        total_users = user_count_result.scalar() or 0
-
-        # Count active users
-        active_user_count_query = select(func.count(User.id)).where(
-            User.tenant_id == tenant_id,
-            User.status == "active"
-        )
-        active_user_count_result =  db.execute(active_user_count_query)
-        active_users = active_user_count_result.scalar() or 0
-
-        # Count products
-        product_count_query = select(func.count(Product.id)).where(Product.tenant_id == tenant_id)
-        product_count_result =  db.execute(product_count_query)
-        total_products = product_count_result.scalar() or 0
-
-        # Count active products
-        active_product_count_query = select(func.count(Product.id)).where(
-            Product.tenant_id == tenant_id,
-            Product.status == "active"
-        )
-        active_product_count_result =  db.execute(active_product_count_query)
-        active_products = active_product_count_result.scalar() or 0
-
-        # Count customers
-        customer_count_query = select(func.count(Customer.id)).where(Customer.tenant_id == tenant_id)
-        customer_count_result =  db.execute(customer_count_query)
-        total_customers = customer_count_result.scalar() or 0
-
-        # Count sales
-        sale_count_query = select(func.count(Sale.id)).where(Sale.tenant_id == tenant_id)
-        sale_count_result =  db.execute(sale_count_query)
-        total_sales = sale_count_result.scalar() or 0
-
-        # Sum total revenue
-        revenue_query = select(func.sum(Sale.total)).where(Sale.tenant_id == tenant_id)
-        revenue_result =  db.execute(revenue_query)
-        total_revenue = revenue_result.scalar() or 0
-
         return {
             "tenant_id": tenant_id,
-            "tenant_name": tenant.name,
-            "total_users": total_users,
-            "active_users": active_users,
-            "total_products": total_products,
-            "active_products": active_products,
-            "total_customers": total_customers,
-            "total_sales": total_sales,
-            "total_revenue": float(total_revenue),
+            "tenant_name": row.name,
+            "total_users": row.total_users,
+            "active_users": row.active_users,
+            "total_products": row.total_products,
+            "active_products": row.active_products,
+            "total_customers": row.total_customers,
+            "total_sales": row.total_sales,
+            "total_revenue": float(row.total_revenue),
+        }
+
+    def get_statistics_bulk(
+        self,
+        db: Session,
+        *,
+        tenant_ids: List[UUID]
+    ) -> Dict[UUID, dict]:
+        """
+        Get statistics for many tenants at once.
+
+        Args:
+            db: Database session
+            tenant_ids: Tenant IDs
+
+        Returns:
+            Dictionary of statistics keyed by tenant ID; unknown IDs are omitted
+        """
+        from app.models.user import User
+        from app.models.product import Product
+        from app.models.customer import Customer
+        from app.models.sale import Sale
+
+        if not tenant_ids:
+            return {}
+
+        # One grouped aggregate per table covering every requested tenant,
+        # outer-joined onto the tenant rows so the whole batch is one statement
+        users = select(
+            User.tenant_id,
+            func.count(User.id).label("total_users"),
+            func.count(User.id).filter(User.status == "active").label("active_users")
+        ).where(User.tenant_id.in_(tenant_ids)).group_by(User.tenant_id).subquery()
+        products = select(
+            Product.tenant_id,
+            func.count(Product.id).label("total_products"),
+            func.count(Product.id).filter(Product.status == "active").label("active_products")
+        ).where(Product.tenant_id.in_(tenant_ids)).group_by(Product.tenant_id).subquery()
+        customers = select(
+            Customer.tenant_id,
+            func.count(Customer.id).label("total_customers")
+        ).where(Customer.tenant_id.in_(tenant_ids)).group_by(Customer.tenant_id).subquery()
+        sales = select(
+            Sale.tenant_id,
+            func.count(Sale.id).label("total_sales"),
+            func.sum(Sale.total).label("total_revenue")
+        ).where(Sale.tenant_id.in_(tenant_ids)).group_by(Sale.tenant_id).subquery()
+
+        query = select(
+            Tenant.id,
+            Tenant.name,
+            users.c.total_users,
+            users.c.active_users,
+            products.c.total_products,
+            products.c.active_products,
+            customers.c.total_customers,
+            sales.c.total_sales,
+            sales.c.total_revenue
+        ).select_from(Tenant).outerjoin(
+            users, users.c.tenant_id == Tenant.id
+        ).outerjoin(
+            products, products.c.tenant_id == Tenant.id
+        ).outerjoin(
+            customers, customers.c.tenant_id == Tenant.id
+        ).outerjoin(
+            sales, sales.c.tenant_id == Tenant.id
+        ).where(Tenant.id.in_(tenant_ids))
+
+        return {
+            row.id: {
+                "tenant_id": row.id,
+                "tenant_name": row.name,
+                "total_users": row.total_users or 0,
+                "active_users": row.active_users or 0,
+                "total_products": row.total_products or 0,
+                "active_products": row.active_products or 0,
+                "total_customers": row.total_customers or 0,
+                "total_sales": row.total_sales or 0,
+                "total_revenue": float(row.total_revenue or 0),
+            }
+            for row in db.execute(query)
         }
 
 
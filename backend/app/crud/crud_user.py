@@ -2,21 +2,79 @@
 CRUD operations for User model.
 """
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Mapping, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, insert, lambda_stmt, select, func, or_, text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, raiseload
 
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
+
+
+# Threads used to hash passwords for bulk user creation
+_HASH_WORKERS = 4
+
+# Resolves the delete policy and performs the delete in a single statement.
+# The checks mirror the order used by the delete endpoint so the reported
+# status matches the first rule that fails.
+_DELETE_WITH_POLICY = text(
+    """
+    WITH target AS (
+        SELECT id, tenant_id, role, store_id
+        FROM users
+        WHERE id = :target_id
+    ),
+    verdict AS (
+        SELECT CASE
+            WHEN tenant_id <> :tenant_id THEN 'forbidden_cross_tenant'
+            WHEN role = 'super_admin' THEN 'forbidden_super_admin'
+            WHEN :actor_role = 'manager' AND role <> 'cashier' THEN 'forbidden_role'
+            WHEN :actor_role = 'manager'
+                 AND store_id IS DISTINCT FROM :actor_store_id THEN 'forbidden_store'
+            WHEN id = :actor_id THEN 'forbidden_self'
+            ELSE 'deleted'
+        END AS status
+        FROM target
+    ),
+    removed AS (
+        DELETE FROM users
+        WHERE id = :target_id
+          AND EXISTS (SELECT 1 FROM verdict WHERE status = 'deleted')
+        RETURNING id
+    )
+    SELECT CASE
+        WHEN EXISTS (SELECT 1 FROM removed) THEN 'deleted'
+        ELSE COALESCE(
+            (SELECT status FROM verdict WHERE status <> 'deleted'),
+            'not_found'
+        )
+    END AS status
+    """
+).bindparams(
+    bindparam("target_id", type_=PGUUID(as_uuid=True)),
+    bindparam("tenant_id", type_=PGUUID(as_uuid=True)),
+    bindparam("actor_id", type_=PGUUID(as_uuid=True)),
+    bindparam("actor_store_id", type_=PGUUID(as_uuid=True)),
+)
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     """
     CRUD operations for User model with multi-tenant support.
+
+    Email lookups, listings and statistics go through lambda_stmt: the SQL
+    is compiled once per call site and reused with new parameters.
     """
 
     def get_by_email(
@@ -37,10 +95,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User instance or None if not found
         """
-        query = select(User).where(User.email == email)
+        email_lc = email.lower()
+        query = lambda_stmt(lambda: select(User).where(User.email_lc == email_lc))
 
         if tenant_id:
-            query = query.where(User.tenant_id == tenant_id)
+            query += lambda s: s.where(User.tenant_id == tenant_id)
 
         result =  db.execute(query)
         return result.scalar_one_or_none()
@@ -65,13 +124,20 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User instance if authentication successful, None otherwise
         """
-        user =  self.get_by_email(db, email=email, tenant_id=tenant_id)
-        if not user:
-            return None
+        user = self.get_by_email(db, email=email, tenant_id=tenant_id)
 
-        if not verify_password(password, user.password_hash):
+        # Always run one password check so unknown emails take as long as wrong passwords
+        password_ok = verify_password(
+            password, user.password_hash if user else DUMMY_PASSWORD_HASH
+        )
+        if not user or not password_ok:
             return None
 
+        # Upgrade legacy bcrypt hashes now that the plain password is known
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = get_password_hash(password)
+            db.commit()
+
         return user
 
     def create(
@@ -95,9 +161,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         # Hash the password
         password_hash = get_password_hash(obj_in.password)
 
-        # Create user data
-        user_data = obj_in.dict()
-        user_data.pop("password")  # Remove plain text password
+        # Create user data without the plain text password
+        user_data = obj_in.model_dump(exclude={"password"})
         user_data["password_hash"] = password_hash
         user_data["tenant_id"] = tenant_id
 
@@ -111,6 +176,56 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db.refresh(db_obj)
         return db_obj
 
+    def create_many(
+        self,
+        db: Session,
+        *,
+        objs_in: List[UserCreate],
+        tenant_id: UUID
+    ) -> List[User]:
+        """
+        Create several users in one INSERT, e.g. for imports and seeding.
+
+        Args:
+            db: Database session
+            objs_in: List of user creation data
+            tenant_id: Tenant ID
+
+        Returns:
+            List of created user instances
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not objs_in:
+            return []
+
+        # Argon2 releases the GIL while hashing; a few threads keep memory
+        # bounded (64 MiB per hash) while overlapping the work
+        with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as pool:
+            password_hashes = list(
+                pool.map(get_password_hash, [obj_in.password for obj_in in objs_in])
+            )
+
+        rows = []
+        for obj_in, password_hash in zip(objs_in, password_hashes):
+            user_data = obj_in.model_dump(exclude={"password"})
+            user_data["password_hash"] = password_hash
+            user_data["tenant_id"] = tenant_id
+            if not user_data.get("status"):
+                user_data["status"] = "active"
+            rows.append(user_data)
+
+        try:
+            # Bulk INSERT ... RETURNING hands back populated instances in one round-trip
+            users = db.scalars(insert(User).returning(User), rows).all()
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise e
+
+        return users
+
     def update(
         self,
         db: Session,
@@ -129,16 +244,61 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             Updated user instance
         """
-        update_data = obj_in.dict(exclude_unset=True)
+        update_data = obj_in.model_dump(exclude_unset=True, exclude={"password"})
 
         # Hash password if provided
-        if "password" in update_data:
-            hashed_password = get_password_hash(update_data["password"])
-            update_data["password_hash"] = hashed_password
-            del update_data["password"]
+        if "password" in obj_in.model_fields_set and obj_in.password:
+            update_data["password_hash"] = get_password_hash(obj_in.password)
 
         return super().update(db, db_obj=db_obj, obj_in=update_data)
 
+    def delete_with_policy(
+        self,
+        db: Session,
+        *,
+        target_id: UUID,
+        tenant_id: UUID,
+        actor_id: UUID,
+        actor_role: str,
+        actor_store_id: Optional[UUID] = None
+    ) -> str:
+        """
+        Delete a user if the acting user is allowed to, in one round trip.
+
+        Args:
+            db: Database session
+            target_id: ID of the user to delete
+            tenant_id: Tenant ID of the acting user
+            actor_id: ID of the acting user
+            actor_role: Role of the acting user
+            actor_store_id: Store ID of the acting user
+
+        Returns:
+            One of "deleted", "not_found", "forbidden_cross_tenant",
+            "forbidden_super_admin", "forbidden_role", "forbidden_store"
+            or "forbidden_self"
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            result = db.execute(
+                _DELETE_WITH_POLICY,
+                {
+                    "target_id": target_id,
+                    "tenant_id": tenant_id,
+                    "actor_id": actor_id,
+                    "actor_role": actor_role,
+                    "actor_store_id": actor_store_id,
+                },
+            )
+            status = result.scalar_one()
+            db.commit()
+            return status
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise e
+
     def get_users_by_role(
         self,
         db: Session,
@@ -161,13 +321,17 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             List of user instances
         """
-        query = select(User).where(User.role == role)
+        # List responses only serialize user columns; fail loudly instead of
+        # lazy-loading a relationship once per row
+        query = lambda_stmt(
+            lambda: select(User).options(raiseload("*")).where(User.role == role)
+        )
 
         if tenant_id:
-            query = query.where(User.tenant_id == tenant_id)
+            query += lambda s: s.where(User.tenant_id == tenant_id)
 
-        query = query.offset(skip).limit(limit).order_by(User.created_at.desc())
-        result =  db.execute(query)
+        query += lambda s: s.offset(skip).limit(limit).order_by(User.created_at.desc())
+        result = db.execute(query)
         return result.scalars().all()
 
     def get_active_users(
@@ -190,13 +354,17 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             List of active user instances
         """
-        query = select(User).where(User.status == "active")
+        # List responses only serialize user columns; fail loudly instead of
+        # lazy-loading a relationship once per row
+        query = lambda_stmt(
+            lambda: select(User).options(raiseload("*")).where(User.status == "active")
+        )
 
         if tenant_id:
-            query = query.where(User.tenant_id == tenant_id)
+            query += lambda s: s.where(User.tenant_id == tenant_id)
 
-        query = query.offset(skip).limit(limit).order_by(User.created_at.desc())
-        result =  db.execute(query)
+        query += lambda s: s.offset(skip).limit(limit).order_by(User.created_at.desc())
+        result = db.execute(query)
         return result.scalars().all()
 
     def search_users(
@@ -221,20 +389,73 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             List of matching user instances
         """
-        search_pattern = f"%{search_term}%"
-        query = select(User).where(
-            and_(
-                User.name.ilike(search_pattern) | User.email.ilike(search_pattern)
+        # Treat LIKE wildcards in the term literally; backslash is the
+        # default LIKE escape character in PostgreSQL
+        escaped_term = (
+            search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        search_pattern = f"%{escaped_term}%"
+        # List responses only serialize user columns; fail loudly instead of
+        # lazy-loading a relationship once per row
+        query = lambda_stmt(
+            lambda: select(User).options(raiseload("*")).where(
+                or_(User.name.ilike(search_pattern), User.email.ilike(search_pattern))
             )
         )
 
         if tenant_id:
-            query = query.where(User.tenant_id == tenant_id)
+            query += lambda s: s.where(User.tenant_id == tenant_id)
 
-        query = query.offset(skip).limit(limit).order_by(User.created_at.desc())
-        result =  db.execute(query)
+        query += lambda s: s.offset(skip).limit(limit).order_by(User.created_at.desc())
+        result = db.execute(query)
         return result.scalars().all()
 
+    def list_users_summary(
+        self,
+        db: Session,
+        *,
+        tenant_id: UUID,
+        store_id: Optional[UUID] = None,
+        role: Optional[str] = None
+    ) -> List[Mapping[str, Any]]:
+        """
+        List users as plain rows for read-only listings.
+
+        Only the columns the user response needs are selected and no ORM
+        instances are built or tracked.
+
+        Args:
+            db: Database session
+            tenant_id: Tenant ID for multi-tenant isolation
+            store_id: Optional store ID to filter users
+            role: Optional role to filter users
+
+        Returns:
+            List of row mappings keyed by column name, newest first
+        """
+        query = lambda_stmt(
+            lambda: select(
+                User.id,
+                User.name,
+                User.email,
+                User.role,
+                User.status,
+                User.store_id,
+                User.created_at,
+                User.updated_at,
+            ).where(User.tenant_id == tenant_id)
+        )
+
+        if store_id:
+            query += lambda s: s.where(User.store_id == store_id)
+
+        if role:
+            query += lambda s: s.where(User.role == role)
+
+        query += lambda s: s.order_by(User.created_at.desc())
+        result = db.execute(query)
+        return result.mappings().all()
+
     def email_exists(
         self,
         db: Session,
@@ -255,17 +476,19 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             True if email exists, False otherwise
         """
-        query = select(func.count(User.id)).where(User.email == email)
+        # Only existence matters, so stop at the first matching row
+        email_lc = email.lower()
+        query = lambda_stmt(lambda: select(1).where(User.email_lc == email_lc))
 
         if tenant_id:
-            query = query.where(User.tenant_id == tenant_id)
+            query += lambda s: s.where(User.tenant_id == tenant_id)
 
         if exclude_user_id:
-            query = query.where(User.id != exclude_user_id)
+            query += lambda s: s.where(User.id != exclude_user_id)
 
-        result =  db.execute(query)
-        count = result.scalar()
-        return count > 0
+        query += lambda s: s.limit(1)
+        result = db.execute(query)
+        return result.first() is not None
 
     def get_user_statistics(
         self,
@@ -283,47 +506,25 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             Dictionary with user statistics
         """
-        query = select(User).where(User.tenant_id == tenant_id) if tenant_id else select(User)
-
-        # Total users
-        total_query = select(func.count(User.id))
-        if tenant_id:
-            total_query = total_query.where(User.tenant_id == tenant_id)
-
-        total_result =  db.execute(total_query)
-        total_users = total_result.scalar() or 0
-
-        # Active users
-        active_query = select(func.count(User.id)).where(User.status == "active")
-        if tenant_id:
-            active_query = active_query.where(User.tenant_id == tenant_id)
-
-        active_result =  db.execute(active_query)
-        active_users = active_result.scalar() or 0
-
-        # Super Admin users
-        admin_query = select(func.count(User.id)).where(User.role == "super_admin")
-        if tenant_id:
-            admin_query = admin_query.where(User.tenant_id == tenant_id)
-
-        admin_result =  db.execute(admin_query)
-        admin_users = admin_result.scalar() or 0
-
-        # Manager users
-        manager_query = select(func.count(User.id)).where(User.role == "manager")
-        if tenant_id:
-            manager_query = manager_query.where(User.tenant_id == tenant_id)
-
-        manager_result =  db.execute(manager_query)
-        manager_users = manager_result.scalar() or 0
-
-        # Cashier users
-        cashier_query = select(func.count(User.id)).where(User.role == "cashier")
+        # All counters come from one pass over the users table
+        query = lambda_stmt(
+            lambda: select(
+                func.count(User.id).label("total_users"),
+                func.count(User.id).filter(User.status == "active").label("active_users"),
+                func.count(User.id).filter(User.role == "super_admin").label("admin_users"),
+                func.count(User.id).filter(User.role == "manager").label("manager_users"),
+                func.count(User.id).filter(User.role == "cashier").label("cashier_users")
+            )
+        )
         if tenant_id:
-            cashier_query = cashier_query.where(User.tenant_id == tenant_id)
-
-        cashier_result =  db.execute(cashier_query)
-        cashier_users = cashier_result.scalar() or 0
+            query += lambda s: s.where(User.tenant_id == tenant_id)
+
+        row = db.execute(query).one()
+        total_users = row.total_users
+        active_users = row.active_users
+        admin_users = row.admin_users
+        manager_users = row.manager_users
+        cashier_users = row.cashier_users
 
         return {
             "total_users": total_users,
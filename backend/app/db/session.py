@@ -1,25 +1,61 @@
 from __future__ import annotations
 
-from typing import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generator, Iterator, List, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 
 
+IS_DEVELOPMENT = settings.app_env.lower() == "development"
+
 engine = create_engine(
     settings.supabase_db_url,
-    echo=settings.app_env == "development",
-    pool_size=5,
-    max_overflow=10,
+    # Echo formats every statement and its parameters; keep it out of production
+    echo=IS_DEVELOPMENT,
+    echo_pool="debug" if settings.sqlalchemy_debug else False,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    # Fail fast under saturation instead of queueing requests for 30s
+    pool_timeout=settings.db_pool_timeout_seconds,
+    pool_recycle=settings.db_pool_recycle_seconds,
     pool_pre_ping=True,
-    execution_options={
-        # Disable prepared statements for PgBouncer session pool compatibility.
-        "psycopg_disable_prepared_statements": True,
-    },
+    # Reuse the most recently returned connection so surplus ones sit idle
+    # and age out instead of every connection being kept barely warm
+    pool_use_lifo=True,
+    # Multi-row INSERTs (sale items) go out as batched VALUES lists with
+    # RETURNING; executemany UPDATE/DELETE use psycopg2's execute_batch
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
 )
 
+# Running SQL statement count for the current request (development only)
+_statement_count: ContextVar[Optional[List[int]]] = ContextVar("statement_count", default=None)
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    counter = _statement_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+@contextmanager
+def count_queries() -> Iterator[List[int]]:
+    """Count SQL statements run in this context; yields a one-item list holding the count."""
+    counter = [0]
+    token = _statement_count.set(counter)
+    try:
+        yield counter
+    finally:
+        _statement_count.reset(token)
+
+
+if IS_DEVELOPMENT:
+    event.listen(engine, "before_cursor_execute", _count_statement)
+
 SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
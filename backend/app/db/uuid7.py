@@ -0,0 +1,24 @@
+"""
+Time-ordered UUIDs (version 7, RFC 9562) for primary keys
+"""
+
+import os
+import time
+from uuid import UUID
+
+
+def uuid7() -> UUID:
+    """Return a UUIDv7: 48-bit Unix millisecond timestamp followed by random bits.
+
+    Consecutive ids sort by creation time, so new rows land at the right edge
+    of the primary key B-tree instead of on a random page.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= (rand >> 62 & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # RFC 9562 variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    return UUID(int=value)
@@ -4,14 +4,15 @@ from uuid import UUID
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import text
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.config import settings
+from app.core.security import decode_token
 from app.api.router import api_router
-from app.db.session import engine
+from app.db.session import IS_DEVELOPMENT, count_queries, engine
 from app.utils.logger import setup_logging, log_request_context
 from app.utils.exceptions import FAPOSException
 from app.utils.error_handlers import log_error
@@ -66,6 +67,7 @@ def create_application() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     allowed_origins = set(settings.frontend_origins or [])
@@ -84,28 +86,33 @@ def create_application() -> FastAPI:
         "allow_headers": ["*"],
     }
 
-    if settings.app_env.lower() == "development":
+    if IS_DEVELOPMENT:
         cors_kwargs["allow_origin_regex"] = r"https?://(localhost|127\.0\.0\.1)(:\d+)?$"
 
     app.add_middleware(CORSMiddleware, **cors_kwargs)
 
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
-        request_id = f"{request.method}_{hash(request.url.path)}_{id(request)}"
+        # Resolve per-request values once; the access log runs on every request
+        method = request.method
+        path = request.url.path
+        request_id = f"{method}_{hash(path)}_{id(request)}"
+        info_enabled = logger.isEnabledFor(logging.INFO)
         user_id = None
-        tenant_id = None
 
+        # Decode the bearer token once; the auth dependency reuses the claims
+        # from request.state instead of verifying the signature again
         auth_header = request.headers.get("authorization")
         if auth_header:
-            try:
-                from app.core.security import decode_token
-                token = auth_header.split(" ")[1] if len(auth_header.split(" ")) > 1 else None
-                if token:
-                    payload = decode_token(token)
-                    user_id = payload.get("sub")
-                    tenant_id = payload.get("tenant_id")
-            except Exception:
-                pass
+            parts = auth_header.split(" ", 1)
+            if len(parts) == 2 and parts[1]:
+                try:
+                    claims = decode_token(parts[1])
+                except Exception:
+                    claims = None
+                if claims is not None:
+                    request.state.jwt_claims = claims
+                    user_id = claims.get("sub")
 
         client_ip = request.client.host if request.client else "unknown"
 
@@ -115,27 +122,37 @@ def create_application() -> FastAPI:
             user_id=UUID(user_id) if user_id else None,
             ip_address=client_ip
         ):
-            logger.info(
-                f"{request.method} {request.url.path}",
-                extra={
-                    'action': 'request_start',
-                    'method': request.method,
-                    'path': request.url.path,
-                    'query_params': str(request.query_params),
-                }
-            )
-
-            response = await call_next(request)
-
-            logger.info(
-                f"{request.method} {request.url.path} - {response.status_code}",
-                extra={
-                    'action': 'request_complete',
-                    'method': request.method,
-                    'path': request.url.path,
-                    'status_code': response.status_code,
-                }
-            )
+            if info_enabled:
+                logger.info(
+                    f"{method} {path}",
+                    extra={
+                        'action': 'request_start',
+                        'method': method,
+                        'path': path,
+                        'query_params': str(request.query_params),
+                    }
+                )
+
+            with count_queries() as query_count:
+                response = await call_next(request)
+
+            if info_enabled:
+                logger.info(
+                    f"{method} {path} - {response.status_code}",
+                    extra={
+                        'action': 'request_complete',
+                        'method': method,
+                        'path': path,
+                        'status_code': response.status_code,
+                    }
+                )
+
+            # Only counted in development; flags N+1 patterns as they appear
+            if query_count[0] > settings.dev_query_count_warning:
+                logger.warning(
+                    f"{method} {path} ran {query_count[0]} SQL statements",
+                    extra={'action': 'query_count_exceeded', 'path': path}
+                )
 
             return response
 
@@ -1,12 +1,13 @@
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String, Text, func
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, Integer, Numeric, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.uuid7 import uuid7
 
 if TYPE_CHECKING:
     from app.models.store import Store
@@ -14,14 +15,64 @@ if TYPE_CHECKING:
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index(
+            "idx_products_name_search_trgm",
+            "name_search",
+            postgresql_using="gin",
+            postgresql_ops={"name_search": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_products_sku_trgm",
+            "sku",
+            postgresql_using="gin",
+            postgresql_ops={"sku": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_products_barcode_trgm",
+            "barcode",
+            postgresql_using="gin",
+            postgresql_ops={"barcode": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_products_category_trgm",
+            "category",
+            postgresql_using="gin",
+            postgresql_ops={"category": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_products_active_stock",
+            "tenant_id",
+            "stock",
+            postgresql_include=["name", "price", "sku"],
+            postgresql_where=text("status = 'active'"),
+        ),
+        Index(
+            "idx_products_out_of_stock",
+            "tenant_id",
+            "name",
+            postgresql_include=["price", "sku"],
+            postgresql_where=text("status = 'active' AND stock = 0"),
+        ),
+        Index(
+            "idx_products_tenant_category",
+            "tenant_id",
+            "category",
+            postgresql_where=text("category IS NOT NULL"),
+        ),
+    )
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
     store_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("stores.id"), nullable=False)
     name: Mapped[str] = mapped_column(String(150), nullable=False)
     sku: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     barcode: Mapped[Optional[str]] = mapped_column(String(100))
     category: Mapped[Optional[str]] = mapped_column(String(100))
+    # lower(unaccent(name)), maintained by Postgres for searching
+    name_search: Mapped[Optional[str]] = mapped_column(
+        Text, Computed("lower(public.f_unaccent(name))", persisted=True)
+    )
     price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
     stock: Mapped[Optional[int]] = mapped_column(Integer, default=0)
     low_stock_threshold: Mapped[Optional[int]] = mapped_column(Integer, default=5)
@@ -33,5 +84,8 @@ class Product(Base):
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    store = relationship("Store", back_populates="products")
-    sale_items = relationship("SaleItem", back_populates="product")
+    # Deleting a product leaves sale_items.product_id to ON DELETE SET NULL
+    store = relationship("Store", back_populates="products", lazy="raise_on_sql")
+    sale_items = relationship(
+        "SaleItem", back_populates="product", passive_deletes=True, lazy="raise_on_sql"
+    )
@@ -1,12 +1,13 @@
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, LargeBinary, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, LargeBinary, String, func, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.uuid7 import uuid7
 
 if TYPE_CHECKING:
     from app.models.store import Store
@@ -16,8 +17,17 @@ if TYPE_CHECKING:
 
 class RazorpayConnection(Base):
     __tablename__ = "razorpay_connections"
+    __table_args__ = (
+        Index(
+            "idx_razorpay_connections_active",
+            "tenant_id",
+            "store_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+    )
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
@@ -54,9 +64,9 @@ class RazorpayConnection(Base):
     )
     replaced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    tenant = relationship("Tenant", back_populates="razorpay_connections")
-    store = relationship("Store", back_populates="razorpay_connections")
-    manager = relationship("User")
+    tenant = relationship("Tenant", back_populates="razorpay_connections", lazy="raise_on_sql")
+    store = relationship("Store", back_populates="razorpay_connections", lazy="raise_on_sql")
+    manager = relationship("User", lazy="raise_on_sql")
 
     def mask_key_id(self) -> str:
         """Return key ID with only last 4 characters visible."""
@@ -1,20 +1,23 @@
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import (
     BigInteger,
     DateTime,
     ForeignKey,
+    Index,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.uuid7 import uuid7
 
 if TYPE_CHECKING:
     from app.models.sale import Sale
@@ -27,9 +30,14 @@ class RazorpayPayment(Base):
     __table_args__ = (
         UniqueConstraint("razorpay_order_id", name="uq_razorpay_order_id"),
         UniqueConstraint("razorpay_payment_id", name="uq_razorpay_payment_id"),
+        Index(
+            "idx_razorpay_payments_sale_created",
+            "sale_id",
+            text("created_at DESC"),
+        ),
     )
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
@@ -46,7 +54,6 @@ class RazorpayPayment(Base):
         PGUUID(as_uuid=True),
         ForeignKey("sales.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     razorpay_order_id: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -70,6 +77,6 @@ class RazorpayPayment(Base):
     )
     captured_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    tenant = relationship("Tenant", back_populates="razorpay_payments")
-    store = relationship("Store", back_populates="razorpay_payments")
-    sale = relationship("Sale", back_populates="razorpay_payments")
+    tenant = relationship("Tenant", back_populates="razorpay_payments", lazy="raise_on_sql")
+    store = relationship("Store", back_populates="razorpay_payments", lazy="raise_on_sql")
+    sale = relationship("Sale", back_populates="razorpay_payments", lazy="raise_on_sql")
@@ -1,12 +1,13 @@
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.uuid7 import uuid7
 
 if TYPE_CHECKING:
     from app.models.store import Store
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
 class Sale(Base):
     __tablename__ = "sales"
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
     store_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("stores.id"), nullable=False)
     invoice_no: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
@@ -40,12 +41,22 @@ class Sale(Base):
         DateTime(timezone=True), server_default=func.now()
     )
 
-    store = relationship("Store", back_populates="sales")
-    customer = relationship("Customer", back_populates="sales")
-    cashier = relationship("User")
-    items = relationship("SaleItem", back_populates="sale", cascade="all, delete-orphan")
+    # Relationships never lazy-load; callers opt in with selectinload/joinedload.
+    # Collections leave deletes to the ON DELETE rules on the foreign keys
+    store = relationship("Store", back_populates="sales", lazy="raise_on_sql")
+    customer = relationship("Customer", back_populates="sales", lazy="raise_on_sql")
+    cashier = relationship("User", lazy="raise_on_sql")
+    items = relationship(
+        "SaleItem",
+        back_populates="sale",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
     razorpay_payments = relationship(
         "RazorpayPayment",
         back_populates="sale",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
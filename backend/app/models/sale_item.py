@@ -1,17 +1,23 @@
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import ForeignKey, Integer, Numeric
+from sqlalchemy import BigInteger, Computed, ForeignKey, Identity, Integer, Numeric
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.uuid7 import uuid7
 
 
 class SaleItem(Base):
     __tablename__ = "sale_items"
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    # Compact internal key for the fastest-growing table; the UUID stays the
+    # public identifier
+    pk_id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), unique=True, nullable=False, default=uuid7
+    )
     tenant_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
     store_id: Mapped[Optional[UUID]] = mapped_column(PGUUID(as_uuid=True), ForeignKey("stores.id"), nullable=True)
     sale_id: Mapped[UUID] = mapped_column(
@@ -23,6 +29,9 @@ class SaleItem(Base):
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
     unit_price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
     total: Mapped[Optional[float]] = mapped_column(Numeric(10, 2))
+    line_total: Mapped[float] = mapped_column(
+        Numeric(12, 2), Computed("quantity * unit_price", persisted=True)
+    )
 
-    sale = relationship("Sale", back_populates="items")
-    product = relationship("Product", back_populates="sale_items")
+    sale = relationship("Sale", back_populates="items", lazy="raise_on_sql")
+    product = relationship("Product", back_populates="sale_items", lazy="raise_on_sql")
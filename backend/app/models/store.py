@@ -1,5 +1,4 @@
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
 from sqlalchemy import Column, String, DateTime, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -7,6 +6,7 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.db.base_class import Base
+from app.db.uuid7 import uuid7
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
 class Store(Base):
     __tablename__ = "stores"
 
-    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     tenant_id = Column(PGUUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False, index=True)
     address = Column(Text, nullable=True)
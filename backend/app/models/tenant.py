@@ -1,12 +1,13 @@
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import DateTime, String
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.uuid7 import uuid7
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
 class Tenant(Base):
     __tablename__ = "tenants"
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(150), nullable=False)
     domain: Mapped[Optional[str]] = mapped_column(String(150), unique=True)
     status: Mapped[str] = mapped_column(String(20), server_default="active")
@@ -28,22 +29,30 @@ class Tenant(Base):
     users: Mapped[List["User"]] = relationship(
         "User",
         back_populates="tenant",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     stores: Mapped[List["Store"]] = relationship(
         "Store",
         back_populates="tenant",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     razorpay_connections: Mapped[List["RazorpayConnection"]] = relationship(
         "RazorpayConnection",
         back_populates="tenant",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     razorpay_payments: Mapped[List["RazorpayPayment"]] = relationship(
         "RazorpayPayment",
         back_populates="tenant",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from uuid import UUID as UUIDType, uuid4
+from uuid import UUID as UUIDType
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func, Boolean
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, String, Text, func, text, Boolean
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.uuid7 import uuid7
 
 if TYPE_CHECKING:
     from app.models.store import Store
@@ -17,11 +18,40 @@ if TYPE_CHECKING:
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("idx_users_email_lc_tenant", "email_lc", "tenant_id", unique=True),
+        Index(
+            "idx_users_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_users_tenant_role_created",
+            "tenant_id",
+            "role",
+            text("created_at DESC"),
+        ),
+        Index(
+            "idx_users_tenant_status_created",
+            "tenant_id",
+            "status",
+            text("created_at DESC"),
+        ),
+    )
 
-    id: Mapped[UUIDType] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUIDType] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[UUIDType] = mapped_column(PGUUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     email: Mapped[str] = mapped_column(String(150), nullable=False, index=True)
+    # Lowercased copy maintained by Postgres for case-insensitive lookups
+    email_lc: Mapped[str] = mapped_column(Text, Computed("lower(email)", persisted=True))
     password_hash: Mapped[str] = mapped_column(Text, nullable=False)
     role: Mapped[str] = mapped_column(String(50), nullable=False)  # super_admin, manager, cashier
     is_global: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
@@ -37,6 +67,7 @@ class User(Base):
     tenant: Mapped["Tenant"] = relationship(
         "Tenant",
         back_populates="users",
+        lazy="raise_on_sql",
     )
 
     # Store relationship
@@ -44,6 +75,7 @@ class User(Base):
         "Store",
         foreign_keys="User.store_id",
         back_populates="users",
+        lazy="raise_on_sql",
     )
 
     # Relationship with sales where user is the cashier
@@ -51,4 +83,6 @@ class User(Base):
         "Sale",
         foreign_keys="Sale.cashier_id",
         back_populates="cashier",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
@@ -455,6 +455,7 @@ class ProductService:
 
         Raises:
             ProductNotFoundError: If product not found
+            InsufficientStockError: If the adjustment exceeds available stock
         """
         product = crud_product.adjust_stock(
             db=self.db,
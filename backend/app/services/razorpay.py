@@ -124,27 +124,21 @@ class RazorpayConnectionService:
         """
         self._validate_credentials(key_id, key_secret)
 
-        # Deactivate existing active connections for this store
-        crud_razorpay_connection.deactivate_connections(
+        # Swap out any previously active connection for this store
+        connection = crud_razorpay_connection.rotate_connection(
             self.db,
             tenant_id=tenant_id,
             store_id=store_id,
+            new_values={
+                "manager_id": manager_id,
+                "razorpay_key_id": key_id.strip(),
+                "razorpay_key_secret": key_secret.strip().encode("utf-8"),
+                "mode": mode,
+                "is_active": True,
+                "connected_at": datetime.utcnow(),
+            },
         )
-
-        connection = RazorpayConnection(
-            tenant_id=tenant_id,
-            store_id=store_id,
-            manager_id=manager_id,
-            razorpay_key_id=key_id.strip(),
-            razorpay_key_secret=key_secret.strip().encode("utf-8"),
-            mode=mode,
-            is_active=True,
-            connected_at=datetime.utcnow(),
-        )
-
-        self.db.add(connection)
         self.db.commit()
-        self.db.refresh(connection)
         logger.info(
             "Razorpay connected for tenant %s store %s by manager %s",
             tenant_id,
@@ -253,7 +247,8 @@ class RazorpayPaymentService:
         payment_id: str,
         signature: str,
     ) -> RazorpayPayment:
-        payment = crud_razorpay_payment.get_by_order_id(
+        # Gateway callbacks carry no tenant; order IDs are globally unique
+        payment = crud_razorpay_payment.get_by_gateway_order_id(
             self.db,
             order_id=order_id,
         )
@@ -9,6 +9,7 @@ from sqlalchemy import Select, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, selectinload
 
+from app.crud.crud_sale import crud_sale
 from app.models.product import Product
 from app.models.sale import Sale
 from app.models.sale_item import SaleItem
@@ -216,6 +217,7 @@ def create_sale(
         session.add(sale_item)
 
     session.commit()
+    crud_sale.invalidate_statistics(tenant_id)
 
     result = session.execute(
         select(Sale)
@@ -266,7 +268,7 @@ def sales_summary(
             SaleItem.product_id,
             Product.name,
             func.coalesce(func.sum(SaleItem.quantity), 0),
-            func.coalesce(func.sum(SaleItem.unit_price * SaleItem.quantity), 0),
+            func.coalesce(func.sum(SaleItem.line_total), 0),
         )
         .join(Sale, Sale.id == SaleItem.sale_id)
         .outerjoin(Product, Product.id == SaleItem.product_id)
@@ -130,10 +130,6 @@ class SalesService:
             SaleStorageError: If invoice upload fails
         """
         try:
-            # Always generate a fresh invoice number for this sale
-            next_invoice = self.get_next_invoice_number(tenant_id)
-            sale_data = sale_data.model_copy(update={"invoice_no": next_invoice})
-
             # Prepare sale data (exclude fields not stored on Sale table)
             sale_data_dict = sale_data.model_dump(
                 exclude={
@@ -145,8 +141,18 @@ class SalesService:
             )
             sale_data_dict["tenant_id"] = tenant_id
 
-            # Create sale
-            sale = crud_sale.create(db=self.db, obj_in=sale_data_dict)
+            # Always generate a fresh invoice number for this sale; the insert
+            # itself rejects numbers already taken, so no pre-check is needed
+            sale = None
+            for _ in range(20):
+                sale_data_dict["invoice_no"] = self._candidate_invoice_number()
+                sale = crud_sale.insert_if_invoice_free(self.db, values=sale_data_dict)
+                if sale is not None:
+                    break
+            if sale is None:
+                raise SalesServiceError("Unable to generate unique invoice number. Please try again.")
+            self.db.commit()
+            crud_sale.invalidate_statistics(tenant_id)
 
             # Upload invoice PDF if provided
             if pdf_content and sale_data.store_id:
@@ -441,6 +447,7 @@ class SalesService:
 
             # Delete sale
             crud_sale.remove(db=self.db, id=sale_id)
+            crud_sale.invalidate_statistics(tenant_id)
             return True
 
         except Exception as e:
@@ -503,11 +510,8 @@ class SalesService:
         """
         Generate a unique invoice number for the tenant using DD/MM/YY-XXXX.
         """
-        date_prefix = datetime.utcnow().strftime("%d/%m/%y")
-
         for _ in range(20):
-            random_digits = secrets.randbelow(10_000)
-            invoice_no = f"{date_prefix}-{random_digits:04d}"
+            invoice_no = self._candidate_invoice_number()
 
             existing_sale = crud_sale.get_by_invoice_no(
                 db=self.db,
@@ -519,3 +523,10 @@ class SalesService:
                 return invoice_no
 
         raise SalesServiceError("Unable to generate unique invoice number. Please try again.")
+
+    @staticmethod
+    def _candidate_invoice_number() -> str:
+        """Random DD/MM/YY-XXXX invoice number; uniqueness is checked by the caller."""
+        date_prefix = datetime.utcnow().strftime("%d/%m/%y")
+        random_digits = secrets.randbelow(10_000)
+        return f"{date_prefix}-{random_digits:04d}"
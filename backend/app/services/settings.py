@@ -1,10 +1,12 @@
 import logging
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.crud.crud_setting import crud_setting
+from app.db.uuid7 import uuid7
 from app.models.setting import Setting
 from app.schemas.setting import SettingUpdate
 
@@ -66,7 +68,7 @@ def get_settings(session: Session, tenant_id: UUID) -> Setting | None:
 
     # Initialize default settings for this tenant
     setting = Setting(
-        id=uuid4(),
+        id=uuid7(),
         tenant_id=tenant_id,
         store_name="My POS Store",
     )
@@ -94,5 +96,6 @@ def update_settings(session: Session, payload: SettingUpdate, tenant_id: UUID) -
         setattr(setting, key, value)
 
     session.commit()
+    crud_setting.invalidate_cache(tenant_id)
     session.refresh(setting)
     return setting
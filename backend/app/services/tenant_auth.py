@@ -7,7 +7,13 @@ from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.models.tenant import Tenant
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    create_access_token,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
 from app.schemas.tenant import LoginRequest, LoginResponse, UserCreate
 
 
@@ -93,7 +99,7 @@ class TenantAuthService:
             .join(Tenant, User.tenant_id == Tenant.id)
             .where(
                 and_(
-                    User.email == email.lower(),
+                    User.email_lc == email.lower(),
                     User.status == "active",
                     Tenant.status == "active"
                 )
@@ -106,15 +112,21 @@ class TenantAuthService:
         result = self.session.execute(statement)
         row = result.first()
 
-        if not row:
-            raise InvalidCredentialsError()
-
-        user, tenant = row
+        user, tenant = row if row else (None, None)
 
-        # Verify password
-        if not verify_password(password, user.password_hash):
+        # Verify password; unknown emails are checked against a dummy hash so
+        # they take as long as wrong passwords
+        password_ok = verify_password(
+            password, user.password_hash if user else DUMMY_PASSWORD_HASH
+        )
+        if not user or not password_ok:
             raise InvalidCredentialsError()
 
+        # Upgrade legacy bcrypt hashes now that the plain password is known
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = get_password_hash(password)
+            self.session.commit()
+
         return user, tenant.id
 
     def login(
@@ -348,7 +360,7 @@ class TenantAuthService:
             result = self._execute_read(
                 select(User).where(
                     and_(
-                        User.email == email.lower(),
+                        User.email_lc == email.lower(),
                         User.tenant_id == tenant_id,
                         User.status == "active"
                     )
@@ -359,7 +371,7 @@ class TenantAuthService:
             result = self._execute_read(
                 select(User).where(
                     and_(
-                        User.email == email.lower(),
+                        User.email_lc == email.lower(),
                         User.role == "super_admin",
                         User.status == "active"
                     )
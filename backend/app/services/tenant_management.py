@@ -3,7 +3,7 @@ from uuid import UUID
 
 from sqlalchemy import select, and_, func
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from app.models.tenant import Tenant
 from app.models.user import User
@@ -231,7 +231,8 @@ class TenantManagementService:
         Returns:
             List of tenant objects
         """
-        statement = select(Tenant)
+        # Only tenant columns are serialized; a lazy load here would be N+1
+        statement = select(Tenant).options(raiseload("*"))
         if not include_inactive:
             statement = statement.where(Tenant.status == "active")
 
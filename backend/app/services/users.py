@@ -1,11 +1,11 @@
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import DUMMY_PASSWORD_HASH, get_password_hash, verify_password
 from app.models.user import User
 from app.schemas.user import UserCreate, UserRole, UserUpdate
 
@@ -19,7 +19,7 @@ class InvalidManagerError(Exception):
 
 
 def get_user_by_email(session: Session, email: str) -> User | None:
-    result = session.execute(select(User).where(User.email == email.lower()))
+    result = session.execute(select(User).where(User.email_lc == email.lower()))
     return result.scalar_one_or_none()
 
 
@@ -45,6 +45,35 @@ def list_users(
     return result.scalars().all()
 
 
+def list_users_for_manager(
+    session: Session,
+    tenant_id: UUID,
+    manager_id: UUID,
+    store_id: UUID | None,
+    role: str | None = None
+) -> Sequence[User]:
+    """Return the manager's own record plus the cashiers of their store."""
+    query = (
+        select(User)
+        .options(raiseload("*"))
+        .where(
+            User.tenant_id == tenant_id,
+            User.role.in_(("cashier", "manager")),
+            or_(
+                and_(User.role == "manager", User.id == manager_id),
+                and_(User.role == "cashier", User.store_id == store_id),
+            ),
+        )
+    )
+
+    if role:
+        query = query.where(User.role == role)
+
+    query = query.order_by(User.created_at.desc())
+    result = session.execute(query)
+    return result.scalars().all()
+
+
 def _get_admin_by_id(session: Session, admin_id: UUID) -> User:
     result = session.execute(select(User).where(User.id == admin_id))
     admin = result.scalar_one_or_none()
@@ -112,7 +141,9 @@ def update_user(session: Session, user_id: UUID, payload: UserUpdate) -> User |
 
 def authenticate_user(session: Session, email: str, password: str) -> User | None:
     user = get_user_by_email(session, email)
-    if not user or not verify_password(password, user.password_hash):
+    # Always run one password check so unknown emails take as long as wrong passwords
+    password_ok = verify_password(password, user.password_hash if user else DUMMY_PASSWORD_HASH)
+    if not user or not password_ok:
         return None
     return user
 
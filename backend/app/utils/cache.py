@@ -0,0 +1,69 @@
+"""
+In-process TTL cache for short-lived, read-mostly values
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a fixed number of seconds.
+
+    Each worker process holds its own copy, so cached values can be up to
+    ``ttl`` seconds stale relative to writes made by other workers.
+
+    delete() bumps a per-key generation. Callers that compute a value
+    outside the cache read generation() first and pass it to set(), so a
+    result computed before a concurrent delete is not stored after it.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._generations: "dict[Hashable, int]" = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def generation(self, key: Hashable) -> int:
+        """Return how many times the key has been deleted"""
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Store a value, evicting the oldest entry when full.
+
+        When generation is given, the value is dropped if the key was
+        deleted since that generation was read.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generations.get(key, 0):
+                return
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a single entry if present"""
+        with self._lock:
+            self._data.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
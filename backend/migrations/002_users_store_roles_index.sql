@@ -0,0 +1,7 @@
+-- FA POS Migration: manager user listing index
+-- Serves the manager view of /users (own record + cashiers of the store)
+-- from a single partial index scan.
+
+CREATE INDEX IF NOT EXISTS idx_users_store_roles
+  ON public.users USING btree (tenant_id, store_id)
+  WHERE role IN ('cashier', 'manager');
@@ -0,0 +1,21 @@
+-- FA POS Migration: trigram indexes for search
+-- search_customers and search_products filter with ILIKE '%term%', which a
+-- btree cannot serve. These GIN indexes let Postgres answer those filters
+-- with index probes (terms of 3+ characters); tenant_id stays on the
+-- existing btree indexes and the planner combines them with a BitmapAnd.
+-- idx_products_name_trgm already exists from 001.
+-- CONCURRENTLY avoids locking writes; run this file outside a transaction.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_customers_name_trgm
+  ON public.customers USING gin (name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_customers_phone_trgm
+  ON public.customers USING gin (phone gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_products_sku_trgm
+  ON public.products USING gin (sku gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_products_barcode_trgm
+  ON public.products USING gin (barcode gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_products_category_trgm
+  ON public.products USING gin (category gin_trgm_ops);
@@ -0,0 +1,6 @@
+-- FA POS Migration: customer phone lookup index
+-- get_by_phone and phone_exists filter on (tenant_id, phone); give them a
+-- btree so the duplicate-phone check is a single index probe.
+
+CREATE INDEX IF NOT EXISTS idx_customers_tenant_phone
+  ON public.customers USING btree (tenant_id, phone);
@@ -0,0 +1,6 @@
+-- FA POS Migration: sales by customer index
+-- Backs the per-customer EXISTS probe used by customer statistics
+-- (completed sales for a given customer).
+
+CREATE INDEX IF NOT EXISTS idx_sales_customer_status
+  ON public.sales USING btree (customer_id, status);
@@ -0,0 +1,14 @@
+-- FA POS Migration: stock alert indexes
+-- get_low_stock_products scans active products in stock order and
+-- get_out_of_stock_products lists active products with no stock by name.
+-- Both are served by partial indexes limited to active rows.
+
+CREATE INDEX IF NOT EXISTS idx_products_active_stock
+  ON public.products USING btree (tenant_id, stock)
+  INCLUDE (name, price, sku)
+  WHERE status = 'active';
+
+CREATE INDEX IF NOT EXISTS idx_products_out_of_stock
+  ON public.products USING btree (tenant_id, name)
+  INCLUDE (price, sku)
+  WHERE status = 'active' AND stock = 0;
@@ -0,0 +1,7 @@
+-- FA POS Migration: product category index
+-- Serves distinct-category lookups (category listing and the category
+-- count in product statistics) per tenant.
+
+CREATE INDEX IF NOT EXISTS idx_products_tenant_category
+  ON public.products USING btree (tenant_id, category)
+  WHERE category IS NOT NULL;
@@ -0,0 +1,31 @@
+-- FA POS Migration: normalized name search columns
+-- Stores lower(unaccent(name)) for customers and products so searches can
+-- match with a plain LIKE against a trigram index instead of case-folding
+-- every row with ILIKE.
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- unaccent() is only STABLE; generated columns need an IMMUTABLE wrapper
+CREATE OR REPLACE FUNCTION public.f_unaccent(text)
+  RETURNS text
+  LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+AS $$
+  SELECT public.unaccent('public.unaccent'::regdictionary, $1)
+$$;
+
+ALTER TABLE public.customers
+  ADD COLUMN IF NOT EXISTS name_search text
+  GENERATED ALWAYS AS (lower(public.f_unaccent(name))) STORED;
+
+ALTER TABLE public.products
+  ADD COLUMN IF NOT EXISTS name_search text
+  GENERATED ALWAYS AS (lower(public.f_unaccent(name))) STORED;
+
+-- Searches now go through name_search; replace the raw name indexes
+DROP INDEX IF EXISTS public.idx_customers_name_trgm;
+DROP INDEX IF EXISTS public.idx_products_name_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_customers_name_search_trgm
+  ON public.customers USING gin (name_search gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_products_name_search_trgm
+  ON public.products USING gin (name_search gin_trgm_ops);
@@ -0,0 +1,8 @@
+-- FA POS Migration: customer listing order index
+-- Customer listings and searches page through a tenant's customers newest
+-- first on (created_at, id); this index returns them in that order without a
+-- sort.
+
+CREATE INDEX IF NOT EXISTS idx_customers_tenant_created
+  ON public.customers USING btree (tenant_id, created_at DESC, id DESC)
+  INCLUDE (name, phone);
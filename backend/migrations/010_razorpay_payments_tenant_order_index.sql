@@ -0,0 +1,5 @@
+-- FA POS Migration: tenant-scoped Razorpay order lookup
+-- get_by_order_id now always filters on (tenant_id, razorpay_order_id).
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_razorpay_payments_tenant_order
+  ON public.razorpay_payments USING btree (tenant_id, razorpay_order_id);
@@ -0,0 +1,9 @@
+-- FA POS Migration: latest payment per sale
+-- get_latest_for_sale reads the newest payment for a sale; this index
+-- returns it as the first entry instead of sorting the sale's payments.
+-- It also covers plain sale_id lookups, so the single-column index goes.
+
+CREATE INDEX IF NOT EXISTS idx_razorpay_payments_sale_created
+  ON public.razorpay_payments USING btree (sale_id, created_at DESC);
+
+DROP INDEX IF EXISTS public.ix_razorpay_payments_sale_id;
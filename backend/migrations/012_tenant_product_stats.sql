@@ -0,0 +1,30 @@
+-- FA POS Migration: product statistics snapshot
+-- Per-tenant product counters served by get_product_statistics without
+-- scanning the tenant's catalog on every dashboard load.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.tenant_product_stats AS
+SELECT
+  tenant_id,
+  count(*) AS total_products,
+  count(*) FILTER (WHERE status = 'active') AS active_products,
+  count(*) FILTER (WHERE status = 'active' AND stock <= 5) AS low_stock_products,
+  count(*) FILTER (WHERE status = 'active' AND stock = 0) AS out_of_stock_products,
+  coalesce(sum(stock * price), 0) AS total_inventory_value,
+  count(DISTINCT category) AS total_categories,
+  now() AS refreshed_at
+FROM public.products
+GROUP BY tenant_id;
+
+-- Required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tenant_product_stats_tenant
+  ON public.tenant_product_stats USING btree (tenant_id);
+
+-- Materialized views bypass RLS; keep them away from client roles
+REVOKE ALL ON public.tenant_product_stats FROM anon, authenticated;
+
+-- Refresh on a schedule, e.g. every 5 minutes with pg_cron:
+-- SELECT cron.schedule(
+--   'refresh-tenant-product-stats',
+--   '*/5 * * * *',
+--   'REFRESH MATERIALIZED VIEW CONCURRENTLY public.tenant_product_stats'
+-- );
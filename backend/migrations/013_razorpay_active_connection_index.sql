@@ -0,0 +1,20 @@
+-- FA POS Migration: one active Razorpay connection per store
+-- Enforces the invariant connect_store maintains and turns the active
+-- connection lookup into a point probe.
+
+-- Keep only the newest active row where duplicates already exist
+UPDATE public.razorpay_connections AS rc
+SET is_active = false, replaced_at = now()
+WHERE rc.is_active
+  AND EXISTS (
+    SELECT 1
+    FROM public.razorpay_connections AS newer
+    WHERE newer.tenant_id = rc.tenant_id
+      AND newer.store_id = rc.store_id
+      AND newer.is_active
+      AND (newer.created_at, newer.id) > (rc.created_at, rc.id)
+  );
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_razorpay_connections_active
+  ON public.razorpay_connections USING btree (tenant_id, store_id)
+  WHERE is_active;
@@ -0,0 +1,6 @@
+-- FA POS Migration: sales by tenant and date index
+-- Sale statistics, summaries and the daily/period listings all filter a
+-- tenant's sales on created_at; this index serves them as range scans.
+
+CREATE INDEX IF NOT EXISTS idx_sales_tenant_created
+  ON public.sales USING btree (tenant_id, created_at DESC);
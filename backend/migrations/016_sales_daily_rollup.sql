@@ -0,0 +1,28 @@
+-- FA POS Migration: daily sales rollup
+-- Per-tenant, per-day sales totals for completed days. get_daily_sales_data
+-- reads these rows and only aggregates sales newer than the rollup live.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.sales_daily_rollup AS
+SELECT
+  tenant_id,
+  date(created_at) AS day,
+  count(*) AS sales_count,
+  coalesce(sum(total), 0) AS revenue,
+  coalesce(sum(discount), 0) AS discount
+FROM public.sales
+WHERE created_at < current_date
+GROUP BY tenant_id, date(created_at);
+
+-- Required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_sales_daily_rollup_tenant_day
+  ON public.sales_daily_rollup USING btree (tenant_id, day);
+
+-- Materialized views bypass RLS; keep them away from client roles
+REVOKE ALL ON public.sales_daily_rollup FROM anon, authenticated;
+
+-- Refresh nightly, e.g. with pg_cron:
+-- SELECT cron.schedule(
+--   'refresh-sales-daily-rollup',
+--   '5 0 * * *',
+--   'REFRESH MATERIALIZED VIEW CONCURRENTLY public.sales_daily_rollup'
+-- );
@@ -0,0 +1,17 @@
+-- FA POS Migration: keyset pagination indexes for sales listings
+-- Sales by customer, cashier and store are paged newest first with a
+-- (created_at, id) cursor; sale items by product are paged by id. Each index
+-- serves its listing as a straight range scan without a sort.
+-- CONCURRENTLY avoids locking writes; run this file outside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sales_tenant_customer_created
+  ON public.sales USING btree (tenant_id, customer_id, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sales_tenant_cashier_created
+  ON public.sales USING btree (tenant_id, cashier_id, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sales_tenant_store_created
+  ON public.sales USING btree (tenant_id, store_id, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sale_items_tenant_product
+  ON public.sale_items USING btree (tenant_id, product_id, id DESC);
@@ -0,0 +1,51 @@
+-- FA POS Migration: per-tenant sales counters
+-- Keeps a running count of each tenant's sales so get_sale_statistics can
+-- report the all-time total without counting every sale on each dashboard
+-- load. Maintained by statement-level triggers on sales.
+
+CREATE TABLE IF NOT EXISTS public.tenant_sales_counters (
+  tenant_id uuid PRIMARY KEY REFERENCES public.tenants(id) ON DELETE CASCADE,
+  sales_count bigint NOT NULL DEFAULT 0
+);
+
+ALTER TABLE public.tenant_sales_counters ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON public.tenant_sales_counters FROM anon, authenticated;
+
+CREATE OR REPLACE FUNCTION public.tenant_sales_counters_insert()
+RETURNS trigger AS $$
+BEGIN
+  INSERT INTO public.tenant_sales_counters AS c (tenant_id, sales_count)
+  SELECT tenant_id, count(*) FROM new_rows GROUP BY tenant_id
+  ON CONFLICT (tenant_id)
+  DO UPDATE SET sales_count = c.sales_count + EXCLUDED.sales_count;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION public.tenant_sales_counters_delete()
+RETURNS trigger AS $$
+BEGIN
+  UPDATE public.tenant_sales_counters AS c
+  SET sales_count = c.sales_count - d.removed
+  FROM (SELECT tenant_id, count(*) AS removed FROM old_rows GROUP BY tenant_id) AS d
+  WHERE c.tenant_id = d.tenant_id;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS trg_sales_count_insert ON public.sales;
+CREATE TRIGGER trg_sales_count_insert
+  AFTER INSERT ON public.sales
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.tenant_sales_counters_insert();
+
+DROP TRIGGER IF EXISTS trg_sales_count_delete ON public.sales;
+CREATE TRIGGER trg_sales_count_delete
+  AFTER DELETE ON public.sales
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.tenant_sales_counters_delete();
+
+-- Backfill from existing sales
+INSERT INTO public.tenant_sales_counters (tenant_id, sales_count)
+SELECT tenant_id, count(*) FROM public.sales GROUP BY tenant_id
+ON CONFLICT (tenant_id) DO UPDATE SET sales_count = EXCLUDED.sales_count;
@@ -0,0 +1,31 @@
+-- FA POS Migration: daily product sales rollup
+-- Per-tenant, per-day, per-product quantities and revenue for completed days.
+-- get_top_products ranks products from these rows and only aggregates sale
+-- items newer than the rollup live.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.product_daily_sales_rollup AS
+SELECT
+  s.tenant_id,
+  date(s.created_at) AS day,
+  si.product_id,
+  sum(si.quantity) AS quantity,
+  coalesce(sum(si.quantity * si.unit_price), 0) AS revenue
+FROM public.sale_items si
+JOIN public.sales s ON s.id = si.sale_id
+WHERE s.created_at < current_date
+  AND si.product_id IS NOT NULL
+GROUP BY s.tenant_id, date(s.created_at), si.product_id;
+
+-- Required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_product_daily_sales_rollup_tenant_day_product
+  ON public.product_daily_sales_rollup USING btree (tenant_id, day, product_id);
+
+-- Materialized views bypass RLS; keep them away from client roles
+REVOKE ALL ON public.product_daily_sales_rollup FROM anon, authenticated;
+
+-- Refresh nightly alongside sales_daily_rollup, e.g. with pg_cron:
+-- SELECT cron.schedule(
+--   'refresh-product-daily-sales-rollup',
+--   '10 0 * * *',
+--   'REFRESH MATERIALIZED VIEW CONCURRENTLY public.product_daily_sales_rollup'
+-- );
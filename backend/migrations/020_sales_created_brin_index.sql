@@ -0,0 +1,9 @@
+-- FA POS Migration: block range index on sales.created_at
+-- Sales are appended in created_at order, so a BRIN index lets date-range
+-- scans that are not scoped to one tenant (the nightly rollup refreshes,
+-- reporting) skip whole block ranges, much like partition pruning, at a
+-- few kilobytes of index size. Tenant-scoped queries keep using
+-- idx_sales_tenant_created.
+
+CREATE INDEX IF NOT EXISTS idx_sales_created_brin
+  ON public.sales USING brin (created_at) WITH (pages_per_range = 32);
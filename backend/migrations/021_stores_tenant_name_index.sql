@@ -0,0 +1,6 @@
+-- FA POS Migration: store name lookup index
+-- get_by_name and name_exists filter on (tenant_id, name); give them a
+-- btree so the duplicate-name check on store creation is a single probe.
+
+CREATE INDEX IF NOT EXISTS idx_stores_tenant_name
+  ON public.stores USING btree (tenant_id, name);
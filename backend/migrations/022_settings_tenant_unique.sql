@@ -0,0 +1,21 @@
+-- FA POS Migration: one settings row per tenant
+-- create_or_update upserts with ON CONFLICT (tenant_id), which needs a unique
+-- index on the column.
+
+-- Keep only the most recently updated row where duplicates already exist,
+-- matching the row get_settings has been treating as current
+DELETE FROM public.settings AS s
+USING (
+  SELECT
+    id,
+    row_number() OVER (
+      PARTITION BY tenant_id
+      ORDER BY updated_at DESC NULLS LAST, created_at DESC NULLS LAST, id DESC
+    ) AS position
+  FROM public.settings
+) AS ranked
+WHERE ranked.id = s.id
+  AND ranked.position > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_settings_tenant_unique
+  ON public.settings USING btree (tenant_id);
@@ -0,0 +1,10 @@
+-- FA POS Migration: store statistics indexes
+-- get_store_statistics filters sales by store_id alone with a half-open
+-- created_at range for today, and sums sale_items by store_id joined to sales.
+-- CONCURRENTLY avoids locking writes; run this file outside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sales_store_created
+  ON public.sales USING btree (store_id, created_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sale_items_store_sale
+  ON public.sale_items USING btree (store_id, sale_id);
@@ -0,0 +1,12 @@
+-- FA POS Migration: stored sale item line totals
+-- Revenue aggregates sum quantity * unit_price per row; store the product once
+-- at write time and cover it in the store index for index-only revenue sums.
+
+ALTER TABLE public.sale_items
+  ADD COLUMN IF NOT EXISTS line_total numeric(12, 2)
+  GENERATED ALWAYS AS (quantity * unit_price) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_sale_items_store_sale_total
+  ON public.sale_items USING btree (store_id, sale_id) INCLUDE (line_total);
+
+DROP INDEX IF EXISTS idx_sale_items_store_sale;
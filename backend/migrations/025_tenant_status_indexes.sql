@@ -0,0 +1,20 @@
+-- FA POS Migration: tenant-scoped status indexes
+-- Store listings filter by tenant and status and page newest first on
+-- (created_at, id); user and product counts filter by tenant and status. Store
+-- names are unique per tenant (name_exists enforces it in the app); back that
+-- with the index.
+-- CONCURRENTLY avoids locking writes; run this file outside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_stores_tenant_status_created
+  ON public.stores USING btree (tenant_id, status, created_at DESC, id DESC);
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_stores_tenant_name_unique
+  ON public.stores USING btree (tenant_id, name);
+
+DROP INDEX CONCURRENTLY IF EXISTS public.idx_stores_tenant_name;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_tenant_status
+  ON public.users USING btree (tenant_id, status);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_products_tenant_status
+  ON public.products USING btree (tenant_id, status);
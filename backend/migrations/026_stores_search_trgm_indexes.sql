@@ -0,0 +1,12 @@
+-- FA POS Migration: trigram indexes for store search
+-- search_stores filters with name ILIKE '%term%' OR address ILIKE '%term%';
+-- a trigram GIN index on each column lets Postgres answer the OR with a
+-- BitmapOr of index probes instead of a sequential scan.
+-- CONCURRENTLY avoids locking writes; run this file outside a transaction.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_stores_name_trgm
+  ON public.stores USING gin (name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_stores_address_trgm
+  ON public.stores USING gin (address gin_trgm_ops);
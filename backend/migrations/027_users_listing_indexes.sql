@@ -0,0 +1,14 @@
+-- FA POS Migration: user listing indexes
+-- get_users_by_role and get_active_users filter by tenant plus role or status
+-- and sort newest first; these indexes return the page without a sort step.
+-- Email lookups are already served by the users_email_tenant_id_key unique
+-- constraint. The status index supersedes idx_users_tenant_status from 025.
+-- CONCURRENTLY avoids locking writes; run this file outside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_tenant_role_created
+  ON public.users USING btree (tenant_id, role, created_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_tenant_status_created
+  ON public.users USING btree (tenant_id, status, created_at DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS public.idx_users_tenant_status;
@@ -0,0 +1,12 @@
+-- FA POS Migration: trigram indexes for user search
+-- search_users filters with name ILIKE '%term%' OR email ILIKE '%term%';
+-- a trigram GIN index on each column lets Postgres answer the OR with a
+-- BitmapOr of index probes instead of a sequential scan.
+-- CONCURRENTLY avoids locking writes; run this file outside a transaction.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_name_trgm
+  ON public.users USING gin (name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_email_trgm
+  ON public.users USING gin (email gin_trgm_ops);
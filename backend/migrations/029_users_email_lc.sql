@@ -0,0 +1,12 @@
+-- FA POS Migration: case-insensitive user email lookups
+-- Postgres keeps a lowercased copy of each email; login and duplicate checks
+-- compare against it, so 'Foo@X' and 'foo@x' are one account per tenant.
+-- email_lc leads the unique index so logins without a tenant can use it too.
+-- The index fails if a tenant already has case-variant duplicates; merge
+-- those accounts before applying.
+
+ALTER TABLE public.users
+  ADD COLUMN IF NOT EXISTS email_lc text GENERATED ALWAYS AS (lower(email)) STORED;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email_lc_tenant
+  ON public.users USING btree (email_lc, tenant_id);
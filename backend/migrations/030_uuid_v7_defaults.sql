@@ -0,0 +1,30 @@
+-- FA POS Migration: time-ordered UUID defaults for insert-heavy tables
+-- The application generates UUIDv7 ids (app/db/uuid7.py); this gives rows
+-- inserted outside the app the same time-ordered ids, so new keys land at
+-- the right edge of the primary key index instead of on random pages.
+-- gen_uuid_v7 overlays the millisecond timestamp on a random v4 UUID and
+-- flips the version nibble from 4 to 7.
+-- Existing random ids stay as they are; REINDEX the primary keys once in a
+-- quiet window to compact the pages they already split.
+
+CREATE OR REPLACE FUNCTION public.gen_uuid_v7() RETURNS uuid
+LANGUAGE sql VOLATILE AS $$
+  SELECT encode(
+    set_bit(
+      set_bit(
+        overlay(
+          uuid_send(gen_random_uuid())
+          PLACING substring(int8send((extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+          FROM 1 FOR 6
+        ),
+        52, 1
+      ),
+      53, 1
+    ),
+    'hex'
+  )::uuid
+$$;
+
+ALTER TABLE public.sales ALTER COLUMN id SET DEFAULT public.gen_uuid_v7();
+ALTER TABLE public.sale_items ALTER COLUMN id SET DEFAULT public.gen_uuid_v7();
+ALTER TABLE public.razorpay_payments ALTER COLUMN id SET DEFAULT public.gen_uuid_v7();
@@ -0,0 +1,17 @@
+-- FA POS Migration: bigint primary key for sale_items
+-- sale_items grows fastest; an 8-byte identity key halves the primary key
+-- index compared with the 16-byte UUID. The UUID id stays unique because
+-- the API and the keyset cursors still use it.
+-- Adding the identity column rewrites the table and the constraint swap
+-- locks it; apply in a quiet window.
+
+ALTER TABLE public.sale_items
+  ADD COLUMN IF NOT EXISTS pk_id bigint GENERATED ALWAYS AS IDENTITY;
+
+ALTER TABLE public.sale_items
+  ADD CONSTRAINT sale_items_id_key UNIQUE (id);
+
+ALTER TABLE public.sale_items DROP CONSTRAINT sale_items_pkey;
+
+ALTER TABLE public.sale_items
+  ADD CONSTRAINT sale_items_pkey PRIMARY KEY (pk_id);
@@ -0,0 +1,14 @@
+-- FA POS Migration: scheduled refresh of the product statistics snapshot
+-- tenant_product_stats (012) only moves when it is refreshed; pg_cron now
+-- refreshes it every 5 minutes. get_product_statistics ignores snapshots
+-- older than product_stats_max_age_seconds and counts live instead, so a
+-- database without this job still serves correct numbers.
+
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+
+-- cron.schedule replaces an existing job with the same name
+SELECT cron.schedule(
+  'refresh-tenant-product-stats',
+  '*/5 * * * *',
+  'REFRESH MATERIALIZED VIEW CONCURRENTLY public.tenant_product_stats'
+);
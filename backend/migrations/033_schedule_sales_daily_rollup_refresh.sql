@@ -0,0 +1,13 @@
+-- FA POS Migration: nightly refresh of the daily sales rollup
+-- sales_daily_rollup (016) only covers days up to its last refresh; without
+-- a job every daily-sales query slowly falls back to the live scan. pg_cron
+-- refreshes it just after midnight, once the previous day is complete.
+
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+
+-- cron.schedule replaces an existing job with the same name
+SELECT cron.schedule(
+  'refresh-sales-daily-rollup',
+  '5 0 * * *',
+  'REFRESH MATERIALIZED VIEW CONCURRENTLY public.sales_daily_rollup'
+);
@@ -0,0 +1,13 @@
+-- FA POS Migration: nightly refresh of the daily product sales rollup
+-- product_daily_sales_rollup (019) only covers days up to its last refresh;
+-- without a job get_top_products slowly falls back to the live join. pg_cron
+-- refreshes it after sales_daily_rollup (033).
+
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+
+-- cron.schedule replaces an existing job with the same name
+SELECT cron.schedule(
+  'refresh-product-daily-sales-rollup',
+  '10 0 * * *',
+  'REFRESH MATERIALIZED VIEW CONCURRENTLY public.product_daily_sales_rollup'
+);
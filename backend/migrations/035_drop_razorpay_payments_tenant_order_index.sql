@@ -0,0 +1,7 @@
+-- FA POS Migration: drop the redundant tenant/order Razorpay index
+-- The only order lookup is the unauthenticated gateway callback, which
+-- searches by razorpay_order_id alone through uq_razorpay_order_id. That
+-- constraint already makes (tenant_id, razorpay_order_id) unique, so the
+-- index from 010 only added write cost.
+
+DROP INDEX IF EXISTS idx_razorpay_payments_tenant_order;